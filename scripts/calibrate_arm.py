@@ -5,8 +5,11 @@ Arm Calibration Script
 Interactive script to find the correct servo angles for rest and spray positions.
 """
 
+import select
 import sys
-import yaml
+import termios
+import tty
+import numpy as np
 from pathlib import Path
 from gpiozero import AngularServo
 from gpiozero.pins.pigpio import PiGPIOFactory
@@ -14,9 +17,18 @@ from gpiozero.pins.pigpio import PiGPIOFactory
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from config_io import load_config, save_config
+
+
+# Precomputed 0-180 -> -90..90 mapping; integer angles become a table lookup
+# so the per-tick smoothing path does no Python arithmetic
+SERVO_LUT = np.arange(0, 181, dtype=np.int16) - 90
+
 
 def angle_to_servo_range(angle: float) -> float:
     """Convert 0-180 degree range to servo's -90 to 90 range."""
+    if float(angle).is_integer():
+        return int(SERVO_LUT[int(angle)])
     return angle - 90
 
 
@@ -25,8 +37,7 @@ def main():
 
     # Load config
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     gpio_config = config['gpio']
     servo_config = config['servo']
@@ -43,7 +54,7 @@ def main():
     servo_1 = AngularServo(gpio_config['servo_1'], min_angle=-90, max_angle=90, pin_factory=factory)
     servo_2 = AngularServo(gpio_config['servo_2'], min_angle=-90, max_angle=90, pin_factory=factory)
 
-    print("\nControls:")
+    print("\nControls (keys take effect immediately, no Enter needed):")
     print("  1/2: Select Servo 1 or Servo 2")
     print("  +/-: Increase/decrease angle by 5 degrees")
     print("  r: Save as REST position")
@@ -52,60 +63,95 @@ def main():
     print()
 
     current_servo = 1
+    dirty = False  # Only rewrite the config if something was actually saved
     angles = {
         1: servo_config['servo_1_rest'],
         2: servo_config['servo_2_rest']
     }
+    # Commanded positions ramp toward the target angles a little each tick
+    # so the arm glides instead of snapping
+    current_angles = {
+        1: float(angles[1]),
+        2: float(angles[2])
+    }
+    SMOOTH_STEP = 2.0  # degrees per tick
+    TICK_PERIOD = 0.05  # seconds between stdin polls / servo ticks
 
-    def move_servo(servo_num, angle):
-        """Move specified servo to angle (0-180 range)."""
+    def set_servo(servo_num, angle):
+        """Write a servo position directly (0-180 range)."""
         servo_angle = angle_to_servo_range(angle)
         if servo_num == 1:
             servo_1.angle = servo_angle
         else:
             servo_2.angle = servo_angle
-        print(f"Servo {servo_num} -> {angle}° (servo range: {servo_angle}°)")
+
+    def servo_tick():
+        """Advance each servo one smoothing step toward its target."""
+        for servo_num in (1, 2):
+            delta = angles[servo_num] - current_angles[servo_num]
+            if abs(delta) < 0.01:
+                continue
+            step = max(-SMOOTH_STEP, min(SMOOTH_STEP, delta))
+            current_angles[servo_num] += step
+            set_servo(servo_num, current_angles[servo_num])
 
     # Move to initial positions
-    move_servo(1, angles[1])
-    move_servo(2, angles[2])
+    set_servo(1, angles[1])
+    set_servo(2, angles[2])
+
+    # Put stdin into cbreak mode so single keypresses are delivered without
+    # blocking; input() would freeze the whole interpreter, preventing the
+    # smoothing ticks from running while waiting for a command
+    stdin_fd = sys.stdin.fileno()
+    old_term_attrs = termios.tcgetattr(stdin_fd)
+    tty.setcbreak(stdin_fd)
 
     try:
+        print(f"Current: Servo {current_servo} at {angles[current_servo]}°")
         while True:
-            print(f"\nCurrent: Servo {current_servo} at {angles[current_servo]}°")
-            cmd = input("Command: ").strip().lower()
-
-            if cmd == '1':
-                current_servo = 1
-                print("Selected Servo 1")
-            elif cmd == '2':
-                current_servo = 2
-                print("Selected Servo 2")
-            elif cmd == '+':
-                angles[current_servo] = min(180, angles[current_servo] + 5)
-                move_servo(current_servo, angles[current_servo])
-            elif cmd == '-':
-                angles[current_servo] = max(0, angles[current_servo] - 5)
-                move_servo(current_servo, angles[current_servo])
-            elif cmd == 'r':
-                config['servo'][f'servo_{current_servo}_rest'] = angles[current_servo]
-                print(f"✓ Saved Servo {current_servo} REST position: {angles[current_servo]}°")
-            elif cmd == 's':
-                config['servo'][f'servo_{current_servo}_spray'] = angles[current_servo]
-                print(f"✓ Saved Servo {current_servo} SPRAY position: {angles[current_servo]}°")
-            elif cmd == 'q':
-                break
-            else:
-                print("Invalid command")
+            readable, _, _ = select.select([sys.stdin], [], [], TICK_PERIOD)
+
+            if readable:
+                cmd = sys.stdin.read(1).lower()
+
+                if cmd == '1':
+                    current_servo = 1
+                    print("Selected Servo 1")
+                elif cmd == '2':
+                    current_servo = 2
+                    print("Selected Servo 2")
+                elif cmd in ('+', '='):
+                    angles[current_servo] = min(180, angles[current_servo] + 5)
+                    print(f"Servo {current_servo} -> {angles[current_servo]}°")
+                elif cmd in ('-', '_'):
+                    angles[current_servo] = max(0, angles[current_servo] - 5)
+                    print(f"Servo {current_servo} -> {angles[current_servo]}°")
+                elif cmd == 'r':
+                    config['servo'][f'servo_{current_servo}_rest'] = angles[current_servo]
+                    dirty = True
+                    print(f"✓ Saved Servo {current_servo} REST position: {angles[current_servo]}°")
+                elif cmd == 's':
+                    config['servo'][f'servo_{current_servo}_spray'] = angles[current_servo]
+                    dirty = True
+                    print(f"✓ Saved Servo {current_servo} SPRAY position: {angles[current_servo]}°")
+                elif cmd == 'q':
+                    break
+
+            # Runs every tick, even while waiting for input
+            servo_tick()
 
     except KeyboardInterrupt:
         print("\n\nInterrupted")
-
-    # Save config
-    print("\nSaving configuration...")
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
-    print(f"✓ Configuration saved to {config_path}")
+    finally:
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term_attrs)
+
+    # Save config (only if something changed)
+    if dirty:
+        print("\nSaving configuration...")
+        save_config(config_path, config)
+        print(f"✓ Configuration saved to {config_path}")
+    else:
+        print("\nNo changes to save")
 
     # Cleanup
     servo_1.close()
@@ -6,9 +6,10 @@ Interactive script to calibrate the mapping between camera coordinates and servo
 This helps the arm accurately aim at detected faces in the camera view.
 """
 
+import argparse
 import sys
-import yaml
 import cv2
+import numpy as np
 from pathlib import Path
 from gpiozero import AngularServo
 from gpiozero.pins.pigpio import PiGPIOFactory
@@ -16,30 +17,109 @@ from gpiozero.pins.pigpio import PiGPIOFactory
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from config_io import load_config, patch_config
+from perf import pin_to_cpu
+# Import the capture module directly to avoid pulling in the heavy detector deps
+from vision.capture import BufferlessVideoCapture
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Calibrate camera-to-servo kinematics")
+    parser.add_argument('--pin-cpu', type=int, default=None, metavar='CORE',
+                        help='Pin the process to a single CPU core to keep the '
+                             'calibration loop cache-resident')
+    return parser.parse_args()
+
+
+# Precomputed 0-180 -> -90..90 mapping; integer angles become a table lookup
+SERVO_LUT = np.arange(0, 181, dtype=np.int16) - 90
+
+# Normalized camera coordinates of each calibration corner
+CAM_COORDS = {
+    'top_left': (0.0, 0.0),
+    'top_right': (1.0, 0.0),
+    'bottom_left': (0.0, 1.0),
+    'bottom_right': (1.0, 1.0)
+}
+
+
+def corner_pixel_positions(w: int, h: int) -> dict:
+    """Pixel positions of the four corner markers for a given frame size."""
+    return {
+        'top_left': (10, 10),
+        'top_right': (w - 10, 10),
+        'bottom_left': (10, h - 10),
+        'bottom_right': (w - 10, h - 10)
+    }
+
 
 def angle_to_servo_range(angle: float) -> float:
     """Convert 0-180 degree range to servo's -90 to 90 range."""
+    if float(angle).is_integer():
+        return int(SERVO_LUT[int(angle)])
     return angle - 90
 
 
+def build_corner_overlay(w: int, h: int, corner_key: str):
+    """
+    Pre-render the static per-corner markers into an overlay buffer.
+
+    The crosshair, "AIM HERE" label and inactive corner dots don't change
+    while calibrating one corner, so draw them once and composite onto each
+    frame with a single masked copy instead of re-rasterizing every frame.
+
+    Returns:
+        (overlay, mask) tuple for cv2.copyTo
+    """
+    overlay = np.zeros((h, w, 3), dtype=np.uint8)
+
+    corners_px = corner_pixel_positions(w, h)
+
+    # Highlight current corner
+    x, y = corners_px[corner_key]
+    cv2.drawMarker(overlay, (x, y), (0, 0, 255), cv2.MARKER_CROSS, 40, 3)
+    cv2.putText(overlay, "AIM HERE", (x - 50, y - 20),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+
+    # Draw other corners
+    for key, pos in corners_px.items():
+        if key != corner_key:
+            cv2.circle(overlay, pos, 5, (0, 255, 0), -1)
+
+    mask = (overlay.any(axis=2).astype(np.uint8)) * 255
+    return overlay, mask
+
+
 def main():
+    args = parse_args()
+
     print("=== Kinematics Calibration ===\n")
+
+    if args.pin_cpu is not None:
+        if pin_to_cpu(args.pin_cpu):
+            print(f"Pinned to CPU {args.pin_cpu}\n")
+        else:
+            print(f"Warning: could not pin to CPU {args.pin_cpu}\n")
     print("This script helps you calibrate the arm's targeting accuracy.")
     print("You'll aim the arm at each corner of the camera view and record the servo angles.\n")
 
     # Load config
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     gpio_config = config['gpio']
     camera_config = config['camera']
 
-    # Initialize camera
+    # Offload per-frame drawing to the GPU via OpenCV's T-API when OpenCL
+    # is available; on unsupported platforms everything stays on the CPU
+    use_opencl = cv2.ocl.haveOpenCL()
+    if use_opencl:
+        cv2.ocl.setUseOpenCL(True)
+        print("OpenCL enabled for frame rendering")
+
+    # Initialize camera (threaded capture that always serves the newest frame)
     print("Initializing camera...")
-    cap = cv2.VideoCapture(camera_config['device_index'])
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_config['width'])
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_config['height'])
+    cap = BufferlessVideoCapture(camera_config)
 
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -102,6 +182,10 @@ def main():
     calibrated_corners = {}
     current_servo = 1
 
+    # Create the window once - recreating it per corner tears down and
+    # rebuilds the X11 window four times for nothing
+    cv2.namedWindow('Calibration View')
+
     for corner_key, corner_name in corners_to_calibrate:
         print(f"\n{'='*50}")
         print(f"Calibrating: {corner_name}")
@@ -110,33 +194,28 @@ def main():
         print("Controls: 1/2=select servo, +/-=adjust, s=save, n=next\n")
 
         saved = False
-        cv2.namedWindow('Calibration View')
+        overlay = None
+        overlay_mask = None
 
         while not saved:
-            # Show camera feed
-            ret, frame = cap.read()
+            # Show camera feed; the short timeout paces the loop against the
+            # camera instead of spinning when no new frame has arrived
+            ret, frame = cap.read(timeout=0.03)
             if ret:
-                # Draw crosshairs at corners
                 h, w = frame.shape[:2]
-                corners_px = {
-                    'top_left': (10, 10),
-                    'top_right': (w - 10, 10),
-                    'bottom_left': (10, h - 10),
-                    'bottom_right': (w - 10, h - 10)
-                }
 
-                # Highlight current corner
-                if corner_key in corners_px:
-                    x, y = corners_px[corner_key]
-                    cv2.drawMarker(frame, (x, y), (0, 0, 255),
-                                  cv2.MARKER_CROSS, 40, 3)
-                    cv2.putText(frame, "AIM HERE", (x - 50, y - 20),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                # Composite the pre-rendered corner markers (built once per corner)
+                if overlay is None:
+                    overlay, overlay_mask = build_corner_overlay(w, h, corner_key)
+                    if use_opencl:
+                        # Keep the static overlay on the device across frames
+                        overlay = cv2.UMat(overlay)
+                        overlay_mask = cv2.UMat(overlay_mask)
 
-                # Draw other corners
-                for key, pos in corners_px.items():
-                    if key != corner_key:
-                        cv2.circle(frame, pos, 5, (0, 255, 0), -1)
+                if use_opencl:
+                    frame = cv2.UMat(frame)
+
+                cv2.copyTo(overlay, overlay_mask, frame)
 
                 # Show current servo angles
                 cv2.putText(frame, f"Servo 1: {angles[1]:.0f}deg", (10, h - 40),
@@ -148,7 +227,7 @@ def main():
 
                 cv2.imshow('Calibration View', frame)
 
-            key = cv2.waitKey(100) & 0xFF
+            key = cv2.waitKey(1) & 0xFF
 
             if key == ord('1'):
                 current_servo = 1
@@ -165,15 +244,8 @@ def main():
                 move_servo(current_servo, angles[current_servo])
                 print(f"Servo {current_servo} -> {angles[current_servo]}°")
             elif key == ord('s'):
-                # Get camera coordinates for this corner
-                cam_coords = {
-                    'top_left': (0.0, 0.0),
-                    'top_right': (1.0, 0.0),
-                    'bottom_left': (0.0, 1.0),
-                    'bottom_right': (1.0, 1.0)
-                }
-
-                cam_x, cam_y = cam_coords[corner_key]
+                # Camera coordinates for this corner
+                cam_x, cam_y = CAM_COORDS[corner_key]
 
                 calibrated_corners[corner_key] = {
                     'cam_x': cam_x,
@@ -191,16 +263,18 @@ def main():
                 else:
                     print("Please save this corner first (press 's')")
 
-        cv2.destroyAllWindows()
+    cv2.destroyAllWindows()
 
     # Save calibration to config
     print("\n" + "="*50)
     print("Saving calibration to config...")
 
-    config['kinematics']['corners'] = calibrated_corners
+    # Patch only the corners subtree so the rest of the file (including
+    # comments) is left untouched
+    def apply_corners(data):
+        data['kinematics']['corners'] = calibrated_corners
 
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    patch_config(config_path, apply_corners)
 
     print(f"✓ Calibration saved to {config_path}")
     print("\nCalibrated corners:")
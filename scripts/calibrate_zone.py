@@ -16,13 +16,13 @@ Interactive script to define the phone detection zone in the camera frame.
 """
 
 import sys
-import yaml
 import cv2
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from config_io import load_config, save_config
 from vision import HandDetector, PhoneZone
 
 
@@ -31,8 +31,7 @@ def main():
 
     # Load config
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     camera_config = config['camera']
     zone_config = config['detection_zone']
@@ -45,8 +44,9 @@ def main():
     print("Note: Green box shows the current detection zone")
     print("      Hand landmarks will be drawn when detected\n")
 
-    # Initialize camera
+    # Initialize camera (MJPG keeps USB bandwidth down vs raw YUYV)
     cap = cv2.VideoCapture(camera_config['device_index'])
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_config['width'])
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_config['height'])
 
@@ -131,8 +131,7 @@ def main():
                 config['detection_zone']['width'] = zone.width
                 config['detection_zone']['height'] = zone.height
 
-                with open(config_path, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False)
+                save_config(config_path, config)
 
                 print(f"✓ Zone saved to {config_path}")
                 print(f"  x={zone.x:.3f}, y={zone.y:.3f}, width={zone.width:.3f}, height={zone.height:.3f}")
@@ -7,37 +7,67 @@ Generates an ArUco marker to place on your phone for reliable detection.
 
 import cv2
 import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def generate_marker(marker_id=0, size_mm=40, dpi=300, output_path="aruco_marker_0.png"):
+def size_in_pixels(size_mm, dpi=300):
+    """Convert a physical size in millimeters to pixels at the given DPI."""
+    return int(size_mm / 25.4 * dpi)
+
+
+def is_up_to_date(output_path):
+    """Skip regeneration when the marker file is newer than this script."""
+    return (os.path.exists(output_path) and
+            os.path.getmtime(output_path) > os.path.getmtime(__file__))
+
+
+def generate_marker(marker_id=0, size_mm=40, dpi=300, output_path="aruco_marker_0.png",
+                    base_marker=None, scratch=None):
     """
     Generate an ArUco marker image.
 
+    The three print sizes share the same bit pattern, so callers can pass a
+    canonical `base_marker` (rendered once at the largest size) and have it
+    rescaled with nearest-neighbor interpolation instead of re-running the
+    ArUco generator per size.
+
     Args:
         marker_id: ArUco marker ID (default: 0 for phone)
         size_mm: Size of marker in millimeters
         dpi: Print resolution in DPI
         output_path: Where to save the marker image
+        base_marker: Optional pre-rendered marker to rescale from
+        scratch: Optional preallocated uint8 buffer to compose the bordered
+            marker in (must be at least the bordered size)
     """
-    # Calculate size in pixels
-    size_inches = size_mm / 25.4
-    size_pixels = int(size_inches * dpi)
-
-    # Get ArUco dictionary (4x4_50)
-    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
-
-    # Generate marker
-    marker_image = cv2.aruco.generateImageMarker(aruco_dict, marker_id, size_pixels)
+    size_pixels = size_in_pixels(size_mm, dpi)
+
+    if base_marker is not None:
+        # Nearest-neighbor keeps the black/white cells crisp when rescaling
+        if base_marker.shape[0] == size_pixels:
+            marker_image = base_marker
+        else:
+            marker_image = cv2.resize(base_marker, (size_pixels, size_pixels),
+                                      interpolation=cv2.INTER_NEAREST)
+    else:
+        # Get ArUco dictionary (4x4_50)
+        aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+        marker_image = cv2.aruco.generateImageMarker(aruco_dict, marker_id, size_pixels)
 
     # Add white border for better detection
     border_size = size_pixels // 10
-    marker_with_border = cv2.copyMakeBorder(
-        marker_image,
-        border_size, border_size, border_size, border_size,
-        cv2.BORDER_CONSTANT,
-        value=255
-    )
+    bordered_pixels = size_pixels + 2 * border_size
+    if scratch is not None and scratch.shape[0] >= bordered_pixels:
+        # Compose into a view of the shared scratch buffer - no allocation
+        marker_with_border = scratch[:bordered_pixels, :bordered_pixels]
+        marker_with_border[:] = 255
+        marker_with_border[border_size:border_size + size_pixels,
+                           border_size:border_size + size_pixels] = marker_image
+    else:
+        marker_with_border = np.pad(marker_image, border_size, mode='constant',
+                                    constant_values=255)
 
     # Save marker
     cv2.imwrite(output_path, marker_with_border)
@@ -59,20 +89,51 @@ def main():
 
     print("Generating ArUco marker ID 0 for phone detection...\n")
 
+    # Render the marker once at the largest size; smaller sizes are
+    # nearest-neighbor downsamples of the same bit pattern
+    max_size_mm = max(size_mm for size_mm, _ in sizes)
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    base_marker = cv2.aruco.generateImageMarker(
+        aruco_dict, 0, size_in_pixels(max_size_mm)
+    )
+
+    # Collect the sizes that actually need rendering; each gets its own
+    # preallocated scratch buffer since the encodes run concurrently
+    pending = []
     for size_mm, description in sizes:
         output_path = output_dir / f"phone_marker_{size_mm}mm.png"
 
-        marker, pixels = generate_marker(
+        if is_up_to_date(output_path):
+            print(f"✓ Up to date: {description}")
+            print(f"  File: {output_path}")
+            print()
+            continue
+
+        pixels = size_in_pixels(size_mm)
+        scratch = np.full((pixels + 2 * (pixels // 10),) * 2, 255, dtype=np.uint8)
+        pending.append((size_mm, description, output_path, scratch))
+
+    def render(task):
+        size_mm, description, output_path, scratch = task
+        _, pixels = generate_marker(
             marker_id=0,
             size_mm=size_mm,
             dpi=300,
-            output_path=str(output_path)
+            output_path=str(output_path),
+            base_marker=base_marker,
+            scratch=scratch
         )
-
-        print(f"✓ Generated {description}")
-        print(f"  File: {output_path}")
-        print(f"  Size: {size_mm}mm ({pixels}x{pixels} pixels @ 300dpi)")
-        print()
+        return description, output_path, size_mm, pixels
+
+    # PNG encoding inside cv2.imwrite releases the GIL, so the three
+    # markers encode in parallel across cores
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for description, output_path, size_mm, pixels in executor.map(render, pending):
+                print(f"✓ Generated {description}")
+                print(f"  File: {output_path}")
+                print(f"  Size: {size_mm}mm ({pixels}x{pixels} pixels @ 300dpi)")
+                print()
 
     print("=" * 60)
     print("HOW TO USE:")
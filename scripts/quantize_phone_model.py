@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Phone Model Quantization Script
+
+Exports the YOLOv8 phone detector to an int8 OpenVINO model (default) or,
+with --format engine, an int8 TensorRT plan for CUDA boards such as a
+Jetson. Int8 roughly doubles throughput over FP16 with negligible accuracy
+loss on the large, stationary "cell phone" target this project cares about.
+
+By default the export calibrates against the COCO128 sample set that
+ultralytics downloads on demand. Pass --capture-frames to instead calibrate
+on frames grabbed from this rig's own camera, which matches the deployed
+lighting and viewpoint.
+
+After running, point the detector at the exported model:
+
+    vision:
+      phone_model_path: yolov8n_int8_openvino_model
+"""
+
+import argparse
+import sys
+import cv2
+from pathlib import Path
+from ultralytics import YOLO
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from config_io import load_config
+from vision.capture import BufferlessVideoCapture
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Quantize the YOLOv8 phone detector to int8")
+    parser.add_argument('--model', default=None,
+                        help='Path to .pt weights (default: vision.model from config)')
+    parser.add_argument('--format', default='openvino', choices=['openvino', 'engine'],
+                        help="Export target: 'openvino' for the Pi CPU, "
+                             "'engine' for a TensorRT plan on CUDA hardware")
+    parser.add_argument('--data', default='coco128.yaml',
+                        help='Ultralytics dataset yaml used for calibration')
+    parser.add_argument('--capture-frames', type=int, default=0, metavar='N',
+                        help='Capture N calibration frames from the camera instead '
+                             'of using --data (recommended: 100-300)')
+    return parser.parse_args()
+
+
+def capture_calibration_frames(camera_config, count, output_dir):
+    """
+    Grab calibration frames from the rig's camera.
+
+    Frames are spaced out slightly so the set covers more than a fraction of
+    a second of the scene.
+
+    Args:
+        camera_config: Camera configuration dict
+        count: Number of frames to capture
+        output_dir: Directory to write frames into
+
+    Returns:
+        Path to a minimal ultralytics dataset yaml referencing the frames
+    """
+    output_dir = Path(output_dir)
+    images_dir = output_dir / 'images'
+    images_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"Capturing {count} calibration frames from camera...")
+    cap = BufferlessVideoCapture(camera_config)
+
+    captured = 0
+    failed_reads = 0
+    while captured < count:
+        ret, frame = cap.read(timeout=1.0)
+        if not ret:
+            # Don't hang silently on a dead camera - each miss already
+            # waited out the read timeout
+            failed_reads += 1
+            if failed_reads >= 10:
+                cap.release()
+                sys.exit(f"Error: no frame from camera after {failed_reads} "
+                         "consecutive reads - check the connection and device index")
+            continue
+        failed_reads = 0
+        cv2.imwrite(str(images_dir / f"calib_{captured:04d}.jpg"), frame)
+        captured += 1
+        if captured % 25 == 0:
+            print(f"  {captured}/{count}")
+
+    cap.release()
+
+    # Minimal dataset yaml - calibration only reads images, labels are unused
+    data_yaml = output_dir / 'calibration.yaml'
+    data_yaml.write_text(
+        f"path: {output_dir.resolve()}\n"
+        "train: images\n"
+        "val: images\n"
+        "names:\n"
+        "  67: cell phone\n"
+    )
+
+    print(f"✓ Calibration set written to {output_dir}")
+    return data_yaml
+
+
+def main():
+    args = parse_args()
+
+    print("=== Phone Model Quantization ===\n")
+
+    config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
+    config = load_config(config_path)
+    vision_config = config['vision']
+
+    model_path = args.model or vision_config.get('model', 'yolov8n.pt')
+    imgsz = vision_config.get('yolo_imgsz', 320)
+
+    data = args.data
+    if args.capture_frames > 0:
+        calib_dir = Path(__file__).parent.parent / 'calibration_frames'
+        data = str(capture_calibration_frames(config['camera'], args.capture_frames, calib_dir))
+
+    print(f"\nExporting {model_path} to int8 {args.format} (imgsz={imgsz})...")
+    print("This downloads calibration data on first run and takes a few minutes.\n")
+
+    # Both targets run post-training quantization calibrated against the
+    # given dataset: OpenVINO via NNCF, TensorRT via its own calibrator
+    # (the latter requires CUDA and builds the plan for the local GPU)
+    model = YOLO(model_path)
+    export_path = model.export(format=args.format, int8=True, imgsz=imgsz,
+                               data=data, batch=1)
+
+    print(f"\n✓ Quantized model exported to: {export_path}")
+    print("\nTo use it, set in config/settings.yaml:")
+    print("  vision:")
+    print(f"    phone_model_path: {export_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,13 +25,22 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 
-# Shared state (will be injected by orchestrator)
-_dnd_state = {"active": False, "last_updated": datetime.now()}
+# Shared state. Plain module-level variables: the vision loop polls
+# is_dnd_active() every frame, and a bool read/write is atomic in CPython,
+# so no dict lookup or lock is needed on the hot path. The ISO timestamp is
+# rendered once per POST instead of on every GET.
+_dnd_active = False
+_dnd_last_updated = datetime.now().isoformat()
+
+
+def is_dnd_active() -> bool:
+    """Whether DND mode is currently active (hot-path accessor)."""
+    return _dnd_active
 
 
 def get_dnd_state():
-    """Get the current DND state dict."""
-    return _dnd_state
+    """Get the current DND state dict (kept for compatibility)."""
+    return {"active": _dnd_active, "last_updated": _dnd_last_updated}
 
 
 @router.post("/dnd", response_model=DNDStatus)
@@ -45,8 +54,9 @@ async def set_dnd_status(status: DNDStatus):
     Returns:
         Confirmed DNDStatus
     """
-    _dnd_state["active"] = status.active
-    _dnd_state["last_updated"] = datetime.now()
+    global _dnd_active, _dnd_last_updated
+    _dnd_active = status.active
+    _dnd_last_updated = datetime.now().isoformat()
     logger.info(f"DND status set to: {status.active}")
     return status
 
@@ -60,8 +70,8 @@ async def get_dnd_status():
         DNDStatusResponse with active status and last updated time
     """
     return DNDStatusResponse(
-        active=_dnd_state["active"],
-        last_updated=_dnd_state["last_updated"].isoformat()
+        active=_dnd_active,
+        last_updated=_dnd_last_updated
     )
 
 
@@ -0,0 +1,117 @@
+import logging
+import os
+import pickle
+import tempfile
+import yaml
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml C bindings when available - the pure-Python PyYAML
+# parser is several times slower, which is noticeable on the Pi.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# ruamel.yaml round-trip mode lets us rewrite only a changed subtree while
+# preserving comments and layout of the rest of the file
+try:
+    from ruamel.yaml import YAML
+    _ruamel = YAML(typ='rt')
+    _ruamel.preserve_quotes = True
+except ImportError:
+    _ruamel = None
+
+
+def load_config(config_path) -> dict:
+    """
+    Load configuration from a YAML file using the fastest available loader.
+
+    Args:
+        config_path: Path to the configuration YAML file
+
+    Returns:
+        Parsed configuration dict
+
+    Raises:
+        FileNotFoundError: If the config file does not exist
+    """
+    path = Path(config_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    # Pickle sidecar cache: on hot starts the YAML parser is skipped
+    # entirely and the config comes back in microseconds. mtime keying
+    # means any edit to the YAML (including save/patch below) invalidates
+    # the cache on the next load.
+    cache_path = path.with_suffix(path.suffix + '.pkl')
+    try:
+        if cache_path.stat().st_mtime >= path.stat().st_mtime:
+            with open(cache_path, 'rb') as f:
+                config = pickle.load(f)
+            logger.info(f"Configuration loaded from cache {cache_path}")
+            return config
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Missing or corrupt cache - re-parse the YAML
+
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # Rewrite the cache atomically so a crash mid-dump can't leave a
+    # truncated file; cache failures never break config loading
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.pkl.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(config, f, protocol=5)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write config cache: {e}")
+
+    logger.info(f"Configuration loaded from {path}")
+    return config
+
+
+def save_config(config_path, config: dict):
+    """
+    Save configuration to a YAML file using the fastest available dumper.
+
+    Args:
+        config_path: Path to the configuration YAML file
+        config: Configuration dict to serialize
+    """
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    logger.info(f"Configuration saved to {config_path}")
+
+
+def patch_config(config_path, patch):
+    """
+    Apply an in-place update to the config file.
+
+    With ruamel.yaml installed, the file is round-tripped so unchanged
+    sections - including comments - are preserved byte-for-byte and only the
+    modified subtree is re-serialized. Falls back to a full safe-load/dump
+    rewrite otherwise.
+
+    Args:
+        config_path: Path to the configuration YAML file
+        patch: Callable that mutates the parsed config dict in place
+    """
+    path = Path(config_path)
+
+    if _ruamel is not None:
+        data = _ruamel.load(path)
+        patch(data)
+        _ruamel.dump(data, path)
+        logger.info(f"Configuration patched in {path} (comments preserved)")
+    else:
+        config = load_config(path)
+        patch(config)
+        save_config(path, config)
@@ -1,11 +1,12 @@
-import time
+import asyncio
 import logging
+import time
 import threading
 from typing import Callable
 from .state import SystemState
 from ..hardware import SpraySequence, ArmKinematics
 from ..vision import HandDetector
-from ..api.routes import get_dnd_state
+from ..api.routes import is_dnd_active
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class Orchestrator:
 
         # Detection configuration
         self.min_detection_frames = config['vision']['min_detection_frames']
+        self.background_detection = config['vision'].get('background_detection', False)
 
         # Control flags
         self._running = False
@@ -46,21 +48,48 @@ class Orchestrator:
 
         logger.info("Orchestrator initialized")
 
-    def _vision_loop(self):
-        """Main vision detection loop (runs in separate thread)."""
+    async def _vision_loop(self):
+        """
+        Main vision detection loop.
+
+        Runs as a coroutine: the blocking YOLO/MediaPipe and GPIO work is
+        offloaded to the default executor so the event loop stays free, and
+        the spray sequence can run concurrently with the next frame's
+        detection.
+        """
         logger.info("Vision loop started")
 
+        loop = asyncio.get_running_loop()
+
+        # Pacing floor: the loop is normally clocked by the blocking frame
+        # read, but if the camera stalls or errors return immediately we
+        # fall back to monotonic deadlines at the configured fps instead of
+        # spinning
+        frame_interval = 1.0 / self.config['camera'].get('fps', 10)
+        deadline = time.monotonic()
+
         # Track last detected face position for targeting
         last_face_position = None
 
         while self._running:
             try:
-                # Get DND status from API state
-                dnd_state = get_dnd_state()
-                dnd_active = dnd_state["active"]
-
-                # Detect hand touching phone and face position
-                hand_touching_phone, face_position, _ = self.hand_detector.detect_hand_in_zone()
+                # Get DND status from API state (plain bool read, no dict)
+                dnd_active = is_dnd_active()
+
+                # Detect hand touching phone and face position (pure
+                # detection - no annotation cost in production). With
+                # background detection on, this just picks up the newest
+                # result the detector thread already produced.
+                if self.background_detection:
+                    result = await loop.run_in_executor(
+                        None, self.hand_detector.get_latest_result
+                    )
+                else:
+                    result = await loop.run_in_executor(None, self.hand_detector.detect)
+                if result is None:
+                    continue
+                hand_touching_phone = result.hand_touching_phone
+                face_position = result.face_position
 
                 # Update last face position if detected
                 if face_position:
@@ -68,13 +97,20 @@ class Orchestrator:
 
                 if hand_touching_phone:
                     detection_count = self.state.increment_detection()
-                    logger.debug(f"Hand touching phone ({detection_count}/{self.min_detection_frames})")
+                    logger.debug("Hand touching phone (%d/%d)", detection_count, self.min_detection_frames)
                 else:
                     # Reset counter if no hand detected
                     if self.state.get_detection_count() > 0:
                         self.state.reset_detections()
                         logger.debug("Hand detection reset")
 
+                # Face detection only matters in the frames just before a
+                # spray; keep it off in steady state and aim with the last
+                # cached position otherwise
+                self.hand_detector.enable_face_detection(
+                    self.state.get_detection_count() >= self.min_detection_frames - 2
+                )
+
                 # Check if we should trigger spray
                 should_spray = (
                     dnd_active and
@@ -90,8 +126,9 @@ class Orchestrator:
                         servo1, servo2 = self.kinematics.get_spray_angles(last_face_position)
                         logger.info(f"Targeting face at ({last_face_position['x']:.3f}, {last_face_position['y']:.3f}) -> Servos ({servo1:.1f}°, {servo2:.1f}°)")
 
-                        # Execute spray with calculated angles
-                        self.spray_sequence.execute(servo1, servo2)
+                        # Execute spray with calculated angles (the waits
+                        # are asyncio.sleep()s, so the loop stays live)
+                        await self.spray_sequence.execute_async(servo1, servo2)
                         self.state.record_spray()
 
                         # Invalidate phone cache so it re-detects after cooldown
@@ -100,26 +137,62 @@ class Orchestrator:
                     except Exception as e:
                         logger.error(f"Error executing spray sequence: {e}")
 
-                # Small sleep to control loop rate
-                # FPS is controlled by camera, but add small delay
-                time.sleep(0.05)
+                # No fixed sleep: detect() blocks until a new frame
+                # arrives, so the loop normally runs exactly once per
+                # camera frame. The deadline only bites when the camera
+                # returns early (stall, read failure).
+                deadline += frame_interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Fell behind (normal case: detection outlasted the
+                    # frame interval) - resynchronize instead of bursting
+                    deadline = time.monotonic()
 
             except Exception as e:
                 logger.error(f"Error in vision loop: {e}")
-                time.sleep(1)  # Longer delay on error
+                await asyncio.sleep(1)  # Longer delay on error
 
         logger.info("Vision loop stopped")
 
+    async def run_async(self):
+        """
+        Run the vision loop on the caller's event loop.
+
+        Preferred entry point: main.run() gathers this with the uvicorn
+        server so detection and API traffic share one loop (and one
+        executor pool) instead of two schedulers fighting over the Pi's
+        cores.
+        """
+        if self._running:
+            logger.warning("Orchestrator already running")
+            return
+
+        self._running = True
+
+        if self.background_detection:
+            self.hand_detector.start_background()
+
+        logger.info("Orchestrator started")
+        await self._vision_loop()
+
     def start(self):
-        """Start the orchestrator and vision loop."""
+        """Start the orchestrator and vision loop on a dedicated thread."""
         if self._running:
             logger.warning("Orchestrator already running")
             return
 
         self._running = True
 
-        # Start vision loop in separate thread
-        self._vision_thread = threading.Thread(target=self._vision_loop, daemon=True)
+        if self.background_detection:
+            self.hand_detector.start_background()
+
+        # Standalone fallback (no shared loop available): run the
+        # coroutine on its own event loop in a daemon thread
+        self._vision_thread = threading.Thread(
+            target=lambda: asyncio.run(self._vision_loop()), daemon=True
+        )
         self._vision_thread.start()
 
         logger.info("Orchestrator started")
@@ -1,12 +1,19 @@
 import time
 import logging
-from threading import Lock
 
 logger = logging.getLogger(__name__)
 
 
 class SystemState:
-    """Thread-safe system state management."""
+    """
+    System state management.
+
+    All mutators run on the vision thread, which is the only writer, so the
+    attributes are plain Python values with no lock - attribute reads and
+    writes are atomic in CPython. If another thread ever needs a view of
+    this state (e.g. a /status endpoint), plain reads give a snapshot that
+    is at worst stale by one frame, which is fine for UI.
+    """
 
     def __init__(self, cooldown_period: float):
         """
@@ -16,7 +23,6 @@ class SystemState:
             cooldown_period: Minimum seconds between spray activations
         """
         self.cooldown_period = cooldown_period
-        self._lock = Lock()
         self._last_spray_time = 0
         self._consecutive_detections = 0
 
@@ -27,16 +33,13 @@ class SystemState:
         Returns:
             True if system is ready to spray again
         """
-        with self._lock:
-            time_since_last = time.time() - self._last_spray_time
-            return time_since_last >= self.cooldown_period
+        return time.time() - self._last_spray_time >= self.cooldown_period
 
     def record_spray(self):
         """Record that a spray just occurred."""
-        with self._lock:
-            self._last_spray_time = time.time()
-            self._consecutive_detections = 0
-            logger.info(f"Spray recorded. Cooldown until {time.time() + self.cooldown_period:.1f}")
+        self._last_spray_time = time.time()
+        self._consecutive_detections = 0
+        logger.info(f"Spray recorded. Cooldown until {self._last_spray_time + self.cooldown_period:.1f}")
 
     def get_cooldown_remaining(self) -> float:
         """
@@ -45,10 +48,8 @@ class SystemState:
         Returns:
             Seconds remaining (0 if ready)
         """
-        with self._lock:
-            elapsed = time.time() - self._last_spray_time
-            remaining = max(0, self.cooldown_period - elapsed)
-            return remaining
+        elapsed = time.time() - self._last_spray_time
+        return max(0, self.cooldown_period - elapsed)
 
     def increment_detection(self) -> int:
         """
@@ -57,16 +58,13 @@ class SystemState:
         Returns:
             New detection count
         """
-        with self._lock:
-            self._consecutive_detections += 1
-            return self._consecutive_detections
+        self._consecutive_detections += 1
+        return self._consecutive_detections
 
     def reset_detections(self):
         """Reset consecutive detection counter."""
-        with self._lock:
-            self._consecutive_detections = 0
+        self._consecutive_detections = 0
 
     def get_detection_count(self) -> int:
         """Get current consecutive detection count."""
-        with self._lock:
-            return self._consecutive_detections
+        return self._consecutive_detections
@@ -1,7 +1,8 @@
 import time
 import logging
 from gpiozero import AngularServo
-from gpiozero.pins.pigpio import PiGPIOFactory
+
+from .pins import get_pin_factory
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +21,8 @@ class RoboticArm:
         """
         self.config = config
 
-        # Use pigpio for better PWM control
-        try:
-            factory = PiGPIOFactory()
-        except Exception as e:
-            logger.warning(f"Could not initialize pigpio, using default: {e}")
-            factory = None
+        # Use the shared pigpio factory for jitter-free DMA PWM
+        factory = get_pin_factory()
 
         # Initialize servos (assuming SG90 servos: -90 to 90 degrees)
         self.servo_1 = AngularServo(
@@ -57,7 +54,7 @@ class RoboticArm:
 
         self.servo_1.angle = angle_1
         self.servo_2.angle = angle_2
-        logger.debug(f"Moved to rest position: ({angle_1}, {angle_2})")
+        logger.debug("Moved to rest position: (%s, %s)", angle_1, angle_2)
 
     def move_to_spray(self):
         """Move arm to spray position."""
@@ -66,7 +63,7 @@ class RoboticArm:
 
         self.servo_1.angle = angle_1
         self.servo_2.angle = angle_2
-        logger.debug(f"Moved to spray position: ({angle_1}, {angle_2})")
+        logger.debug("Moved to spray position: (%s, %s)", angle_1, angle_2)
 
     def move_smooth(self, target_1: float, target_2: float, duration: float):
         """
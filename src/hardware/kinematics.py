@@ -5,6 +5,24 @@ from typing import Tuple, Dict
 logger = logging.getLogger(__name__)
 
 
+def _bilinear(x, y, a, bx, cy, dxy):
+    """
+    Evaluate the bilinear calibration surface.
+
+    Works on scalars or ndarrays. JIT-compiled with Numba when available,
+    which matters for batched use (trajectory smoothing / predictive aim
+    over many recent face positions); plain NumPy otherwise.
+    """
+    return a + bx * x + cy * y + dxy * x * y
+
+
+try:
+    from numba import njit
+    _bilinear = njit(cache=True, fastmath=True)(_bilinear)
+except ImportError:
+    pass
+
+
 class ArmKinematics:
     """
     Inverse kinematics for 2DOF robotic arm.
@@ -15,6 +33,9 @@ class ArmKinematics:
     - Servo 2 controls vertical tilt (elevation)
     """
 
+    # Resolution of the precomputed calibration lookup table
+    LUT_SIZE = 64
+
     def __init__(self, calibration: dict):
         """
         Initialize kinematics with calibration data.
@@ -40,13 +61,53 @@ class ArmKinematics:
         self.bottom_left = corners.get('bottom_left', {'cam_x': 0.0, 'cam_y': 1.0, 'servo1': 60, 'servo2': 80})
         self.bottom_right = corners.get('bottom_right', {'cam_x': 1.0, 'cam_y': 1.0, 'servo1': 120, 'servo2': 80})
 
+        self._precompute_coefficients()
+        self._rebuild_lut()
+
         logger.info("Arm kinematics initialized with calibration")
 
+    def _precompute_coefficients(self):
+        """
+        Fold the corner points into bilinear coefficients.
+
+        The interpolation servo = a + bx*x + cy*y + dxy*x*y is algebraically
+        identical to the edge-by-edge form but evaluates with 4 multiplies
+        per servo and no intermediate terms. Recomputed whenever a corner
+        changes.
+        """
+        tl, tr, bl, br = self.top_left, self.top_right, self.bottom_left, self.bottom_right
+
+        self._a1 = float(tl['servo1'])
+        self._bx1 = float(tr['servo1'] - tl['servo1'])
+        self._cy1 = float(bl['servo1'] - tl['servo1'])
+        self._dxy1 = float(tl['servo1'] - tr['servo1'] - bl['servo1'] + br['servo1'])
+
+        self._a2 = float(tl['servo2'])
+        self._bx2 = float(tr['servo2'] - tl['servo2'])
+        self._cy2 = float(bl['servo2'] - tl['servo2'])
+        self._dxy2 = float(tl['servo2'] - tr['servo2'] - bl['servo2'] + br['servo2'])
+
+    def _rebuild_lut(self):
+        """
+        Precompute the calibration surface as a lookup table.
+
+        The bilinear surface is sampled on a 64x64 grid; a per-call lookup
+        is then two integer indexes instead of the full interpolation. The
+        64-step quantization is ~1.6% of the frame - well below the spray
+        cone's accuracy - and the table is rebuilt whenever a corner
+        changes.
+        """
+        grid = np.linspace(0.0, 1.0, self.LUT_SIZE, dtype=np.float32)
+        gx, gy = np.meshgrid(grid, grid)
+        servo1, servo2 = self.camera_to_servo_angles_batch(gx, gy)
+        self._lut = np.stack([servo1, servo2], axis=-1).astype(np.float32)
+
     def camera_to_servo_angles(self, cam_x: float, cam_y: float) -> Tuple[float, float]:
         """
         Convert normalized camera coordinates to servo angles.
 
-        Uses bilinear interpolation across calibrated corner points.
+        Samples the precomputed calibration LUT (nearest entry) - O(1) and
+        allocation-free, cheap enough for per-frame live aiming.
 
         Args:
             cam_x: Normalized camera X coordinate (0=left, 1=right)
@@ -56,29 +117,37 @@ class ArmKinematics:
             (servo1_angle, servo2_angle) tuple in degrees (0-180)
         """
         # Clamp to valid range
-        cam_x = np.clip(cam_x, 0.0, 1.0)
-        cam_y = np.clip(cam_y, 0.0, 1.0)
+        cam_x = min(max(cam_x, 0.0), 1.0)
+        cam_y = min(max(cam_y, 0.0), 1.0)
+
+        scale = self.LUT_SIZE - 1
+        servo1, servo2 = self._lut[int(cam_y * scale + 0.5), int(cam_x * scale + 0.5)]
 
-        # Bilinear interpolation
-        # Interpolate top edge
-        top_servo1 = self.top_left['servo1'] + cam_x * (self.top_right['servo1'] - self.top_left['servo1'])
-        top_servo2 = self.top_left['servo2'] + cam_x * (self.top_right['servo2'] - self.top_left['servo2'])
+        logger.debug("Camera (%.3f, %.3f) -> Servo angles (%.1f°, %.1f°)",
+                     cam_x, cam_y, servo1, servo2)
+
+        return float(servo1), float(servo2)
 
-        # Interpolate bottom edge
-        bottom_servo1 = self.bottom_left['servo1'] + cam_x * (self.bottom_right['servo1'] - self.bottom_left['servo1'])
-        bottom_servo2 = self.bottom_left['servo2'] + cam_x * (self.bottom_right['servo2'] - self.bottom_left['servo2'])
+    def camera_to_servo_angles_batch(self, cam_x: np.ndarray,
+                                     cam_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized variant for batch diagnostics (e.g. plotting the
+        calibration surface over a grid of camera coordinates).
 
-        # Interpolate between top and bottom
-        servo1 = top_servo1 + cam_y * (bottom_servo1 - top_servo1)
-        servo2 = top_servo2 + cam_y * (bottom_servo2 - top_servo2)
+        Args:
+            cam_x: Array of normalized camera X coordinates
+            cam_y: Array of normalized camera Y coordinates
 
-        # Clamp to valid servo range
-        servo1 = np.clip(servo1, 0, 180)
-        servo2 = np.clip(servo2, 0, 180)
+        Returns:
+            (servo1_angles, servo2_angles) arrays in degrees (0-180)
+        """
+        cam_x = np.clip(cam_x, 0.0, 1.0)
+        cam_y = np.clip(cam_y, 0.0, 1.0)
 
-        logger.debug(f"Camera ({cam_x:.3f}, {cam_y:.3f}) -> Servo angles ({servo1:.1f}°, {servo2:.1f}°)")
+        servo1 = _bilinear(cam_x, cam_y, self._a1, self._bx1, self._cy1, self._dxy1)
+        servo2 = _bilinear(cam_x, cam_y, self._a2, self._bx2, self._cy2, self._dxy2)
 
-        return float(servo1), float(servo2)
+        return np.clip(servo1, 0, 180), np.clip(servo2, 0, 180)
 
     def get_spray_angles(self, hand_position: Dict[str, float]) -> Tuple[float, float]:
         """
@@ -117,6 +186,9 @@ class ArmKinematics:
         else:
             raise ValueError(f"Invalid corner: {corner}")
 
+        self._precompute_coefficients()
+        self._rebuild_lut()
+
         logger.info(f"Updated {corner} calibration: cam({cam_x:.3f}, {cam_y:.3f}) -> servos({servo1:.1f}°, {servo2:.1f}°)")
 
     def get_calibration_dict(self) -> dict:
@@ -0,0 +1,33 @@
+import logging
+from gpiozero.pins.pigpio import PiGPIOFactory
+
+logger = logging.getLogger(__name__)
+
+# Shared pin factory for every GPIO device. pigpio generates PWM in its
+# daemon via DMA, so servo pulses are jitter-free and pin toggles skip the
+# slow RPi.GPIO Python roundtrip; one factory means one daemon connection
+# for the whole process.
+_factory = None
+_factory_resolved = False
+
+
+def get_pin_factory():
+    """
+    Get the process-wide pigpio pin factory.
+
+    Returns:
+        A shared PiGPIOFactory, or None when pigpiod isn't reachable
+        (gpiozero then falls back to its default factory)
+    """
+    global _factory, _factory_resolved
+
+    if not _factory_resolved:
+        try:
+            _factory = PiGPIOFactory()
+            logger.info("Using pigpio pin factory (DMA PWM)")
+        except Exception as e:
+            logger.warning(f"Could not initialize pigpio, using default: {e}")
+            _factory = None
+        _factory_resolved = True
+
+    return _factory
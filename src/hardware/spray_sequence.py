@@ -1,3 +1,4 @@
+import asyncio
 import time
 import logging
 from .arm import RoboticArm
@@ -22,6 +23,15 @@ class SpraySequence:
         self.pump = pump
         self.servo_config = config['servo']
         self.pump_config = config['pump']
+
+        # Pre-resolve the hot config values into attributes so the
+        # time-critical sequence does plain attribute loads instead of
+        # dict lookups between hardware steps
+        self._move_duration = float(self.servo_config['movement_duration'])
+        self._spray_duration = float(self.pump_config['spray_duration'])
+        self._servo_1_rest = float(self.servo_config['servo_1_rest'])
+        self._servo_2_rest = float(self.servo_config['servo_2_rest'])
+
         logger.info("Spray sequence initialized")
 
     def execute(self, target_servo1: float, target_servo2: float):
@@ -40,21 +50,25 @@ class SpraySequence:
             self.arm.move_smooth(
                 target_servo1,
                 target_servo2,
-                self.servo_config['movement_duration']
+                self._move_duration
             )
 
             # Step 2: Wait for arm to stabilize
             time.sleep(0.3)
 
-            # Step 3: Activate pump
-            self.pump.spray(self.pump_config['spray_duration'])
+            # Step 3: Activate pump (on/sleep/off inline, matching
+            # execute_async - the spray() wrapper adds nothing here)
+            logger.info("Spraying for %s seconds", self._spray_duration)
+            self.pump.on()
+            time.sleep(self._spray_duration)
+            self.pump.off()
 
             # Step 4: Return arm to rest position
             logger.debug("Returning arm to rest position")
             self.arm.move_smooth(
-                self.servo_config['servo_1_rest'],
-                self.servo_config['servo_2_rest'],
-                self.servo_config['movement_duration']
+                self._servo_1_rest,
+                self._servo_2_rest,
+                self._move_duration
             )
 
             logger.info("Spray sequence completed")
@@ -70,6 +84,64 @@ class SpraySequence:
                 pass
             raise
 
+    async def execute_async(self, target_servo1: float, target_servo2: float):
+        """
+        Async variant of execute() for event-loop callers.
+
+        The stabilization wait and the spray duration become
+        asyncio.sleep()s, so the event loop keeps serving detection and API
+        traffic while the hardware does its thing; only the stepped servo
+        moves (which sleep internally) are pushed to the executor.
+
+        Args:
+            target_servo1: Target angle for servo 1 (0-180 degrees)
+            target_servo2: Target angle for servo 2 (0-180 degrees)
+        """
+        logger.info(f"Starting spray sequence targeting ({target_servo1:.1f}°, {target_servo2:.1f}°)")
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            # Step 1: Move arm to target position
+            logger.debug("Moving arm to target position")
+            await loop.run_in_executor(
+                None, self.arm.move_smooth,
+                target_servo1, target_servo2, self._move_duration
+            )
+
+            # Step 2: Wait for arm to stabilize
+            await asyncio.sleep(0.3)
+
+            # Step 3: Activate pump
+            logger.info("Spraying for %s seconds", self._spray_duration)
+            self.pump.on()
+            await asyncio.sleep(self._spray_duration)
+            self.pump.off()
+
+            # Step 4: Return arm to rest position
+            logger.debug("Returning arm to rest position")
+            await loop.run_in_executor(
+                None, self.arm.move_smooth,
+                self._servo_1_rest, self._servo_2_rest,
+                self._move_duration
+            )
+
+            logger.info("Spray sequence completed")
+
+        except Exception as e:
+            logger.error(f"Error during spray sequence: {e}")
+            # Try to return arm to rest
+            try:
+                self.arm.move_to_rest()
+            except:
+                pass
+            raise
+        finally:
+            # except Exception doesn't catch CancelledError - if the task
+            # is cancelled between pump.on() and pump.off() (e.g. during
+            # shutdown) the pump must still be switched off
+            self.pump.off()
+
     def cleanup(self):
         """Clean up hardware resources."""
         self.pump.cleanup()
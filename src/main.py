@@ -6,16 +6,16 @@ Coordinates the web API, vision detection, and hardware control
 to spray water when a hand is detected near a phone while DND is active.
 """
 
+import asyncio
 import logging
 import signal
 import sys
-import yaml
 import uvicorn
 from pathlib import Path
-from threading import Thread
 
 # Import components
 from api.server import create_app
+from config_io import load_config
 from hardware import RoboticArm, WaterPump, SpraySequence, ArmKinematics
 from vision import HandDetector
 from core import Orchestrator
@@ -83,31 +83,40 @@ class PhoneFreeDesk:
         logger.info("Phone Free Desk initialized successfully")
 
     def _load_config(self, config_path: str) -> dict:
-        """Load configuration from YAML file."""
-        path = Path(config_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        logger.info(f"Configuration loaded from {config_path}")
-        return config
+        """Load configuration (fast loader with pickle sidecar cache)."""
+        return load_config(config_path)
+
+    async def _serve(self):
+        """Run the vision loop and the API server on one event loop."""
+        server_config = uvicorn.Config(
+            self.app,
+            host=self.config['api']['host'],
+            port=self.config['api']['port'],
+            log_level="info",
+            loop="asyncio"
+        )
+        server = uvicorn.Server(server_config)
+
+        # uvicorn installs its own SIGINT/SIGTERM handlers (overriding the
+        # ones from main()), so serve() returning is the shutdown signal.
+        # Tie the vision loop's lifetime to it: stop the orchestrator and
+        # await the vision task so asyncio.run can return and run()'s
+        # finally-cleanup actually executes.
+        vision_task = asyncio.create_task(self.orchestrator.run_async())
+        try:
+            await server.serve()
+        finally:
+            self.orchestrator.stop()
+            await vision_task
 
     def run(self):
         """Run the application."""
         try:
-            # Start orchestrator
-            self.orchestrator.start()
-
-            # Run FastAPI server (blocking)
+            # Single shared event loop: the orchestrator's vision loop and
+            # uvicorn cooperate on one scheduler (and one executor pool)
+            # instead of running on separate threads
             logger.info(f"Starting API server on {self.config['api']['host']}:{self.config['api']['port']}")
-            uvicorn.run(
-                self.app,
-                host=self.config['api']['host'],
-                port=self.config['api']['port'],
-                log_level="info"
-            )
+            asyncio.run(self._serve())
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
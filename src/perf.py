@@ -0,0 +1,39 @@
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def pin_to_cpu(core: int, raise_priority: bool = True) -> bool:
+    """
+    Pin the current process to a single CPU core.
+
+    The Linux scheduler freely migrates processes across cores, which
+    invalidates the L1/L2 caches warmed up by the detection loop. Pinning
+    keeps the hot inference path cache-resident and reduces frame-time
+    variance under background load (SSH, housekeeping on other cores).
+
+    Args:
+        core: CPU core number to pin to
+        raise_priority: Also try to lower niceness (needs root; ignored if denied)
+
+    Returns:
+        True if the affinity was applied
+    """
+    try:
+        os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Could not pin process to CPU {core}: {e}")
+        return False
+
+    logger.info(f"Process pinned to CPU {core}")
+
+    if raise_priority:
+        try:
+            os.nice(-5)
+            logger.info("Process priority raised (nice -5)")
+        except OSError:
+            # Not running as root - priority stays at default
+            logger.debug("Could not raise process priority (not root)")
+
+    return True
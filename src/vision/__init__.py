@@ -1,3 +1,14 @@
-from .detector import HandDetector
+from .capture import BufferlessVideoCapture
+from .zone import PhoneZone
 
-__all__ = ['HandDetector']
+__all__ = ['BufferlessVideoCapture', 'DetectionResult', 'HandDetector', 'PhoneZone']
+
+
+def __getattr__(name):
+    # Resolve the detector lazily: importing it pulls in mediapipe and
+    # ultralytics (seconds of startup on the Pi), which the calibration
+    # and quantization scripts that only need capture/zone shouldn't pay
+    if name in ('DetectionResult', 'HandDetector'):
+        from . import detector
+        return getattr(detector, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,126 @@
+import cv2
+import logging
+import time
+from threading import Event, Lock, Thread
+
+logger = logging.getLogger(__name__)
+
+
+class BufferlessVideoCapture:
+    """
+    Threaded cv2.VideoCapture wrapper that always returns the newest frame.
+
+    On V4L2 a plain cap.read() blocks until the next frame is demuxed, and
+    stale frames accumulate in the driver buffer so detection lags behind
+    reality. A daemon reader thread continuously pulls frames and keeps only
+    the most recent one in a single-slot queue, so the inference/UI thread
+    never waits on camera I/O and always sees the freshest frame.
+    """
+
+    def __init__(self, camera_config: dict):
+        """
+        Initialize the capture and start the reader thread.
+
+        Args:
+            camera_config: Camera configuration dict (device_index, width, height, fps)
+        """
+        self.cap = cv2.VideoCapture(camera_config['device_index'])
+
+        # Keep the driver-side queue as short as possible
+        # (not all backends honor this, hence the reader thread as well)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Request MJPG before setting the resolution: raw YUYV saturates
+        # USB 2.0 at higher modes, while MJPG decode lands in libjpeg-turbo
+        # (NEON-accelerated) on a much smaller payload
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_config['width'])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_config['height'])
+        if 'fps' in camera_config:
+            self.cap.set(cv2.CAP_PROP_FPS, camera_config['fps'])
+
+        # Flush the driver's startup backlog: the first frames arrive with
+        # auto-exposure/white-balance still settling and can predate the
+        # property changes above
+        for _ in range(5):
+            self.cap.grab()
+
+        self._lock = Lock()
+        self._new_frame = Event()
+        self._running = True
+        self._thread = Thread(target=self._reader, daemon=True)
+        self._thread.start()
+
+        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc_name = ''.join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4))
+        logger.info(
+            f"Bufferless capture started on device {camera_config['device_index']} "
+            f"(pixel format: {fourcc_name})"
+        )
+
+    def _reader(self):
+        """
+        Continuously grab frames without decoding them.
+
+        cap.grab() only demuxes the frame (cheap); the expensive JPEG/YUV->BGR
+        decode happens in cap.retrieve(), which read() performs on demand for
+        the newest grabbed frame only. Dropped frames are never decoded.
+        """
+        while self._running:
+            with self._lock:
+                grabbed = self.cap.grab()
+            if not grabbed:
+                time.sleep(0.01)
+                continue
+            self._new_frame.set()
+
+    def read(self, timeout: float = 1.0):
+        """
+        Decode and return the most recent frame.
+
+        Args:
+            timeout: Max seconds to wait for a fresh frame
+
+        Returns:
+            (ret, frame) tuple matching the cv2.VideoCapture API
+        """
+        if not self._new_frame.wait(timeout):
+            return False, None
+        self._new_frame.clear()
+        with self._lock:
+            return self.cap.retrieve()
+
+    def grab_only(self, timeout: float = 1.0) -> bool:
+        """
+        Consume the pending frame without decoding it (frame skipping).
+
+        Args:
+            timeout: Max seconds to wait for a fresh frame
+
+        Returns:
+            True if a frame was skipped
+        """
+        if not self._new_frame.wait(timeout):
+            return False
+        self._new_frame.clear()
+        return True
+
+    def get(self, prop):
+        """Passthrough to cv2.VideoCapture.get()."""
+        return self.cap.get(prop)
+
+    def set(self, prop, value):
+        """Passthrough to cv2.VideoCapture.set()."""
+        return self.cap.set(prop, value)
+
+    def isOpened(self):
+        """Passthrough to cv2.VideoCapture.isOpened()."""
+        return self.cap.isOpened()
+
+    def release(self):
+        """Stop the reader thread and release the camera."""
+        self._running = False
+        self._thread.join(timeout=2)
+        self.cap.release()
+        logger.info("Bufferless capture released")
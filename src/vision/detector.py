@@ -1,15 +1,46 @@
 import cv2
 import logging
+import os
+
+# Cap TFLite/XNNPACK threading before mediapipe (and its TF runtime) loads:
+# left alone each claims every core and thrashes against YOLO's own pool
+os.environ.setdefault('TF_NUM_INTRAOP_THREADS', '2')
+os.environ.setdefault('TF_NUM_INTEROP_THREADS', '1')
+os.environ.setdefault('XNNPACK_NUM_THREADS', '2')
+
 import mediapipe as mp
 import numpy as np
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, Dict, List
 from pathlib import Path
 from ultralytics import YOLO
 
+from .capture import BufferlessVideoCapture
+from .zone import PhoneZone
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DetectionResult:
+    """
+    Results of one detection pass over a frame.
+
+    Produced by HandDetector.detect(); pass to HandDetector.annotate() to
+    draw it. 'hands' holds (bbox, landmarks, is_touching) tuples with bbox
+    as (x, y, w, h) in frame pixels.
+    """
+    hand_touching_phone: bool = False
+    face_position: Optional[Dict[str, float]] = None
+    phone_bbox: Optional[Tuple[int, int, int, int]] = None
+    hands: List[tuple] = field(default_factory=list)
+    face_detections: list = field(default_factory=list)
+    frame: Optional[cv2.Mat] = None
+
+
 class HandDetector:
     """
     Hybrid detection system:
@@ -18,17 +49,22 @@ class HandDetector:
     - MediaPipe Face for face targeting (precise aiming)
     """
 
-    def __init__(self, camera_config: dict, vision_config: dict = None):
+    def __init__(self, camera_config: dict, vision_config: dict = None,
+                 zone: Optional[PhoneZone] = None):
         """
         Initialize hybrid detector.
 
         Args:
             camera_config: Camera configuration dict
             vision_config: Vision configuration dict (optional, for backwards compat)
+            zone: Optional fixed phone zone used when YOLO has no bbox yet
         """
         self.camera_config = camera_config
 
         # Handle both old and new API
+        if isinstance(vision_config, PhoneZone):
+            # Oldest API: (camera_config, zone, confidence_threshold)
+            vision_config, zone = zone, vision_config
         if vision_config is None:
             vision_config = {'phone_confidence': 0.3, 'hand_confidence': 0.7, 'face_confidence': 0.7}
         elif isinstance(vision_config, (int, float)):
@@ -36,15 +72,26 @@ class HandDetector:
             conf = float(vision_config)
             vision_config = {'phone_confidence': 0.3, 'hand_confidence': conf, 'face_confidence': conf}
 
+        # Zone-based fallback: stands in for the phone bbox until YOLO has
+        # seen the phone (used by the deprecated calibration workflow)
+        self.zone = zone
+
         self.vision_config = vision_config
 
         # Get config values
         model_path = vision_config.get('model', 'yolov8n.pt')
         self.phone_confidence = vision_config.get('phone_confidence', 0.3)
         self.hand_confidence = vision_config.get('hand_confidence', 0.7)
+        self.hand_tracking_confidence = vision_config.get('hand_tracking_confidence', 0.5)
+        self.max_num_hands = vision_config.get('max_num_hands', 1)
+        self.hand_model_complexity = vision_config.get('hand_model_complexity', 0)
+        self.hand_roi_padding = vision_config.get('hand_roi_padding', 150)
+        self.hand_roi_full_interval = vision_config.get('hand_roi_full_interval', 15)
         self.face_confidence = vision_config.get('face_confidence', 0.7)
+        self.face_detect_interval = vision_config.get('face_detect_interval', 3)
         self.phone_cache_duration = vision_config.get('phone_cache_duration', 30.0)  # seconds
-        self.yolo_imgsz = vision_config.get('yolo_imgsz', 320)
+        self.yolo_imgsz = vision_config.get('yolo_imgsz', 192)
+        self.use_gpu_delegate = vision_config.get('use_gpu_delegate', False)
         self.debug = vision_config.get('debug', False)
         self.show_timing = vision_config.get('show_timing', False)
 
@@ -52,38 +99,185 @@ class HandDetector:
         self.last_phone_bbox = None  # Cached phone position
         self.phone_detection_time = None  # Timestamp of last phone detection
 
+        # Face detection gate - the orchestrator disables it while nobody
+        # is reaching for the phone (see enable_face_detection)
+        self._face_enabled = True
+
+        # Optional background inference thread (see start_background):
+        # publishes the newest DetectionResult into a single slot so
+        # consumers never block on capture or model latency
+        self._bg_thread = None
+        self._bg_stop = threading.Event()
+        self._bg_new = threading.Event()
+        self._bg_lock = threading.Lock()
+        self._bg_result = None
+
+        # Worker that runs the face graph concurrently with the hand graph
+        # (both are independent TFLite models and XNNPACK releases the GIL
+        # during native inference, so they genuinely overlap)
+        self._face_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='face')
+
+        # Frame counter for the periodic full-frame hand pass that backs
+        # up the phone-neighbourhood ROI crop (see _run_hands)
+        self._roi_counter = 0
+
+        # Face detection runs every face_detect_interval frames; heads
+        # barely move between frames, so off-interval frames reuse the
+        # last detections for aiming and annotation
+        self._face_counter = 0
+        self._last_face_detections = []
+
+        # Lightweight tracker that follows the phone between YOLO runs.
+        # A CSRT update costs a fraction of a millisecond vs tens of ms for
+        # YOLO, so the cached bbox stays accurate if the phone gets nudged
+        # without re-running the detector every frame.
+        self._phone_tracker = None
+
+        # An explicit pre-exported model (e.g. the int8 OpenVINO directory
+        # produced by scripts/quantize_phone_model.py) overrides everything -
+        # no conversion logic runs, we just load what's there
+        phone_model_path = vision_config.get('phone_model_path')
+        if phone_model_path:
+            if Path(phone_model_path).exists():
+                logger.info(f"Using pre-exported phone model: {phone_model_path}")
+                model_path = str(phone_model_path)
+            else:
+                logger.warning(
+                    f"phone_model_path not found at {phone_model_path}, falling back to {model_path}"
+                )
+
+        # Optionally swap in an int8-quantized ONNX model. FP32 inference has
+        # no useful SIMD on the Pi's CPU; int8 halves activation bytes and
+        # uses the NEON int8 dot-product kernels via ONNX Runtime. Convert
+        # offline once with onnxruntime.quantization.quantize_dynamic.
+        self.quantized = vision_config.get('quantized', False)
+        if self.quantized and model_path.endswith('.pt'):
+            int8_path = Path(model_path).with_name(Path(model_path).stem + '_int8.onnx')
+            if int8_path.exists():
+                logger.info(f"Using int8 quantized model: {int8_path}")
+                model_path = str(int8_path)
+            else:
+                logger.warning(
+                    f"Quantized model not found at {int8_path}, falling back to {model_path}"
+                )
+
+        # Resolve the configured inference backend (exported once, cached
+        # next to the weights)
+        self.phone_backend = vision_config.get('phone_backend', 'pytorch')
+        model_path = self._resolve_model(model_path, self.phone_backend)
+
         # Initialize YOLOv8 model (for phone detection only)
         logger.info(f"Loading YOLOv8 model: {model_path}")
         logger.info(f"Phone confidence: {self.phone_confidence}")
         logger.info(f"Phone cache duration: {self.phone_cache_duration}s (stays valid even when occluded)")
         logger.info(f"YOLOv8 image size: {self.yolo_imgsz} (lower = faster)")
-        self.model = YOLO(model_path)
+
+        # For the onnx backend, run the model through a raw ONNX Runtime
+        # session with persistently bound IO buffers instead of ultralytics'
+        # AutoBackend - skips per-frame tensor allocation and copies
+        self._onnx_session = None
+        if self.phone_backend == 'onnx' and model_path.endswith('.onnx'):
+            try:
+                from .onnx_backend import OnnxPhoneSession
+                self._onnx_session = OnnxPhoneSession(model_path, self.yolo_imgsz)
+            except (ImportError, ValueError) as e:
+                logger.warning(f"IO-bound ONNX session unavailable ({e}), using AutoBackend")
+
+        self.model = None if self._onnx_session is not None else YOLO(model_path)
+
+        # Leave the MediaPipe cores alone: torch otherwise sizes its
+        # intra-op pool to every core and the two runtimes context-switch
+        # thrash instead of running side by side
+        if self.model is not None:
+            try:
+                import torch
+                torch.set_num_threads(max(1, (os.cpu_count() or 4) - 2))
+            except ImportError:
+                pass
+
+        # FP16 autocast for CUDA-backed PyTorch inference (Turing and
+        # newer have FP16 tensor cores): cheapest precision win when no
+        # exported engine is in use. Irrelevant on the Pi - stays off
+        # without CUDA.
+        self._torch = None
+        if self.model is not None and self.phone_backend == 'pytorch':
+            try:
+                import torch
+                if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 7:
+                    self._torch = torch
+                    logger.info("Using FP16 autocast for YOLO inference")
+            except ImportError:
+                pass
         self.CLASS_PHONE = 67  # cell phone in COCO dataset
+        # Wrist + five fingertips: the landmarks that can actually touch
+        # the phone (MediaPipe hand landmark indices)
+        self.KEY_LANDMARKS = (0, 4, 8, 12, 16, 20)
 
         # Initialize MediaPipe Hands
         logger.info(f"Initializing MediaPipe Hands (confidence: {self.hand_confidence})")
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=self.hand_confidence,
-            min_tracking_confidence=self.hand_confidence
-        )
+        self.hands = None
+        self.face_detection = None
+
+        # Optional GPU delegation through the Tasks API: the legacy
+        # solutions below are CPU-only, so on hardware with a usable GPU
+        # this moves both TFLite graphs off the cores running YOLO. Falls
+        # back to the CPU solutions if the delegate or model assets are
+        # unavailable (always the case on a stock Pi).
+        if self.use_gpu_delegate:
+            try:
+                from .tasks_backend import GpuFaceDetector, GpuHandLandmarker
+                self.hands = GpuHandLandmarker(
+                    vision_config.get('hand_task_model', 'hand_landmarker.task'),
+                    self.max_num_hands,
+                    self.hand_confidence,
+                    self.hand_tracking_confidence
+                )
+                self.face_detection = GpuFaceDetector(
+                    vision_config.get('face_task_model', 'blaze_face_short_range.tflite'),
+                    self.face_confidence
+                )
+            except Exception as e:
+                logger.warning(f"GPU delegate unavailable ({e}), using CPU solutions")
+                if self.hands is not None:
+                    self.hands.close()
+                self.hands = None
+                self.face_detection = None
+
+        if self.hands is None:
+            # model_complexity=0 selects the lite landmark model (~2x faster on
+            # the Pi CPU); one hand is enough to detect a reach for the phone
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=self.max_num_hands,
+                model_complexity=self.hand_model_complexity,
+                min_detection_confidence=self.hand_confidence,
+                # Tracking threshold sits below the detection threshold so a
+                # briefly low-scoring frame (motion blur, dropped frame) keeps
+                # the tracker alive instead of re-running the palm detector
+                min_tracking_confidence=self.hand_tracking_confidence
+            )
+
+        # Pre-resolve the drawing helpers once; mp.solutions.* lookups walk
+        # several module levels and annotate() runs per displayed frame
+        self.mp_drawing = mp.solutions.drawing_utils
+        self._hand_connections = self.mp_hands.HAND_CONNECTIONS
+        # Matching draw_landmarks' defaults, built once instead of per call
+        self._landmark_spec = self.mp_drawing.DrawingSpec(color=self.mp_drawing.RED_COLOR)
+        self._connection_spec = self.mp_drawing.DrawingSpec()
 
         # Initialize MediaPipe Face Detection
         logger.info(f"Initializing MediaPipe Face Detection (confidence: {self.face_confidence})")
         self.mp_face = mp.solutions.face_detection
-        self.face_detection = self.mp_face.FaceDetection(
-            min_detection_confidence=self.face_confidence
-        )
+        if self.face_detection is None:
+            self.face_detection = self.mp_face.FaceDetection(
+                min_detection_confidence=self.face_confidence
+            )
 
         logger.info(f"Debug: {self.debug}, Show timing: {self.show_timing}")
 
-        # Initialize camera
-        self.cap = cv2.VideoCapture(camera_config['device_index'])
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_config['width'])
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_config['height'])
-        self.cap.set(cv2.CAP_PROP_FPS, camera_config['fps'])
+        # Initialize camera (threaded capture that always serves the newest frame)
+        self.cap = BufferlessVideoCapture(camera_config)
 
         if not self.cap.isOpened():
             raise RuntimeError("Could not open camera")
@@ -92,8 +286,115 @@ class HandDetector:
         self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
+        # MediaPipe's palm/face detectors resize to ~192-256px internally,
+        # so feed them a pre-shrunk frame: the BGR->RGB conversion and copy
+        # then move 4x fewer bytes, which is what this pipeline is bound on.
+        # Landmarks come back normalized, so mapping to full-res pixels is
+        # unchanged.
+        self._mp_size = (320, 240)
+
+        # Reusable buffers for the downscale and BGR->RGB steps: cvtColor
+        # and resize otherwise allocate a fresh ndarray per frame, which at
+        # camera rate is steady churn through the allocator and page cache
+        if (self.frame_width, self.frame_height) > self._mp_size:
+            proc_w, proc_h = self._mp_size
+        else:
+            proc_w, proc_h = self.frame_width, self.frame_height
+        self._small_buf = np.empty((proc_h, proc_w, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty((proc_h, proc_w, 3), dtype=np.uint8)
+
+        # On CUDA builds of OpenCV (e.g. a Jetson) run the colour
+        # conversion on the GPU so the CPU never touches those bytes;
+        # stock Pi builds have no CUDA module and keep the plain path
+        self._use_cuda_cvt = False
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                self._gpu_bgr = cv2.cuda_GpuMat()
+                self._use_cuda_cvt = True
+                logger.info("Using CUDA for BGR->RGB conversion")
+        except (AttributeError, cv2.error):
+            pass
+
+        # Warm-start the models with a dummy frame: the first inference
+        # compiles TFLite graphs / traces the YOLO backend and costs
+        # hundreds of ms, so pay it here rather than on the first real
+        # hand-reaching-for-phone frame
+        warm = np.zeros((self.frame_height, self.frame_width, 3), dtype=np.uint8)
+        try:
+            if self._onnx_session is not None:
+                self._onnx_session.detect_phones(warm, self.phone_confidence)
+            else:
+                self.model(warm, verbose=False, imgsz=self.yolo_imgsz)
+            self.hands.process(warm)
+            self.face_detection.process(warm)
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+
         logger.info(f"Detector initialized at {self.frame_width}x{self.frame_height}")
 
+    def _resolve_model(self, model_path: str, backend: str) -> str:
+        """
+        Resolve the model path for the configured inference backend.
+
+        The PyTorch weights are exported once on first use and the exported
+        model is cached next to them, so subsequent startups just load it.
+        Any failure falls back to the original path.
+
+        Args:
+            model_path: Path to the .pt weights from config
+            backend: 'pytorch', 'openvino', 'onnx', 'ncnn' or 'engine'
+
+        Returns:
+            Path (or directory) to load with YOLO()
+        """
+        if backend == 'pytorch' or not model_path.endswith('.pt'):
+            return model_path
+
+        if backend == 'openvino':
+            # Keep OpenVINO's threading in check before it initializes
+            os.environ.setdefault('OMP_NUM_THREADS', str(os.cpu_count() or 1))
+            export_dir = Path(model_path).with_name(f"{Path(model_path).stem}_openvino_model")
+            export_kwargs = {'format': 'openvino', 'half': True}
+        elif backend == 'onnx':
+            # Fixed shapes so the ONNX Runtime session can bind IO buffers
+            export_dir = Path(model_path).with_suffix('.onnx')
+            export_kwargs = {'format': 'onnx', 'dynamic': False, 'simplify': True,
+                             'opset': 17}
+        elif backend == 'ncnn':
+            # ncnn's Vulkan path can offload inference to the Pi's
+            # VideoCore GPU, freeing the CPU cores for MediaPipe
+            export_dir = Path(model_path).with_name(f"{Path(model_path).stem}_ncnn_model")
+            export_kwargs = {'format': 'ncnn', 'half': True}
+        elif backend == 'engine':
+            # TensorRT FP16 plan: only meaningful on CUDA hardware
+            # (e.g. a Jetson) - on the Pi this falls straight back to .pt
+            try:
+                import torch
+                has_cuda = torch.cuda.is_available()
+            except ImportError:
+                has_cuda = False
+            if not has_cuda:
+                logger.warning("'engine' backend needs CUDA, falling back to PyTorch")
+                return model_path
+            export_dir = Path(model_path).with_suffix('.engine')
+            export_kwargs = {'format': 'engine', 'half': True, 'device': 0,
+                             'dynamic': False, 'workspace': 4}
+        else:
+            logger.warning(f"Unknown phone backend '{backend}', using PyTorch")
+            return model_path
+
+        if export_dir.exists():
+            return str(export_dir)
+
+        try:
+            logger.info(f"Exporting {model_path} to {backend} (one-time, may take a while)...")
+            YOLO(model_path).export(imgsz=self.yolo_imgsz, **export_kwargs)
+            logger.info(f"Export complete: {export_dir}")
+            return str(export_dir)
+        except Exception as e:
+            logger.warning(f"{backend} export failed ({e}), falling back to {model_path}")
+            return model_path
+
     def _detect_phone(self, frame: cv2.Mat, force: bool = False) -> Optional[Tuple[int, int, int, int]]:
         """
         Detect phone using YOLOv8.
@@ -116,55 +417,190 @@ class HandDetector:
             if self.last_phone_bbox is not None and self.phone_detection_time is not None:
                 age = current_time - self.phone_detection_time
                 if age < self.phone_cache_duration:
-                    # Cache is still valid
+                    # Cache is still valid - let the tracker refine the bbox.
+                    # If it loses lock (usually a hand covering the phone) we
+                    # keep the last known position rather than re-detecting,
+                    # since occlusion is exactly the trigger scenario.
+                    if self._phone_tracker is not None:
+                        ok, bbox = self._phone_tracker.update(frame)
+                        if ok:
+                            self.last_phone_bbox = tuple(int(v) for v in bbox)
+                        else:
+                            if self.debug:
+                                logger.info("Phone tracker lost lock, keeping cached bbox")
+                            self._phone_tracker = None
                     return self.last_phone_bbox
                 else:
                     if self.debug:
-                        logger.info(f"Phone cache expired after {age:.1f}s, re-detecting...")
+                        logger.info("Phone cache expired after %.1fs, re-detecting...", age)
 
         # Run YOLOv8 inference with smaller image size for speed
         if self.show_timing:
             start_time = time.time()
 
-        results = self.model(frame, conf=0.1, verbose=False, imgsz=self.yolo_imgsz)[0]
+        if self._onnx_session is not None:
+            phone_detections = np.asarray(
+                self._onnx_session.detect_phones(frame, self.phone_confidence),
+                dtype=np.float32
+            ).reshape(-1, 5)
+        else:
+            # Restrict inference to the cell phone class - NMS and box decoding
+            # then only ever touch one class worth of candidates
+            if self._torch is not None:
+                with self._torch.inference_mode(), \
+                        self._torch.autocast('cuda', dtype=self._torch.float16):
+                    results = self.model(frame, conf=self.phone_confidence, verbose=False,
+                                         imgsz=self.yolo_imgsz, classes=[self.CLASS_PHONE],
+                                         agnostic_nms=True)[0]
+            else:
+                results = self.model(frame, conf=self.phone_confidence, verbose=False,
+                                     imgsz=self.yolo_imgsz, classes=[self.CLASS_PHONE],
+                                     agnostic_nms=True)[0]
+
+            # Bulk-read the result tensors once (a single device sync)
+            # and build an SoA (N, 5) [x, y, w, h, conf] array instead of
+            # per-box scalar conversions - classes=[67] and conf= already
+            # filtered inside NMS, so every surviving box is a phone
+            boxes = results.boxes
+            xyxy = boxes.xyxy.cpu().numpy()
+            phone_detections = np.empty((xyxy.shape[0], 5), dtype=np.float32)
+            phone_detections[:, 0] = xyxy[:, 0]
+            phone_detections[:, 1] = xyxy[:, 1]
+            phone_detections[:, 2] = xyxy[:, 2] - xyxy[:, 0]
+            phone_detections[:, 3] = xyxy[:, 3] - xyxy[:, 1]
+            phone_detections[:, 4] = boxes.conf.cpu().numpy()
+
+        # isEnabledFor guard: skip iterating the detections entirely when
+        # the records would be dropped by the logger anyway
+        if self.debug and logger.isEnabledFor(logging.INFO):
+            for x, y, w, h, confidence in phone_detections:
+                logger.info("PHONE detected: conf=%.3f, bbox=(%d,%d,%d,%d)",
+                            confidence, x, y, w, h)
 
         if self.show_timing:
             yolo_time = (time.time() - start_time) * 1000
-            logger.info(f"YOLOv8 inference: {yolo_time:.1f}ms (caching for {self.phone_cache_duration}s)")
-
-        phone_detections = []
-
-        # Parse detections
-        for box in results.boxes:
-            cls_id = int(box.cls[0])
-            confidence = float(box.conf[0])
+            logger.info("YOLOv8 inference: %.1fms (caching for %ss)", yolo_time, self.phone_cache_duration)
 
-            if cls_id == self.CLASS_PHONE and confidence >= self.phone_confidence:
-                # Get bounding box coordinates (xyxy format)
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                # Convert to xywh format
-                x, y, w, h = x1, y1, x2 - x1, y2 - y1
-                phone_detections.append((x, y, w, h, confidence))
-
-                if self.debug:
-                    logger.info(f"PHONE detected: conf={confidence:.3f}, bbox=({x},{y},{w},{h})")
-
-        if self.debug and not phone_detections:
+        if self.debug and not len(phone_detections):
             logger.info("No phone detected in this frame")
 
-        # Cache and return highest confidence phone
-        if phone_detections:
-            phone_detections.sort(key=lambda x: x[4], reverse=True)
-            x, y, w, h, conf = phone_detections[0]
+        # Cache and return highest confidence phone - single-pass argmax,
+        # no need to order the rest
+        if len(phone_detections):
+            best = phone_detections[phone_detections[:, 4].argmax()]
+            x, y, w, h = (int(v) for v in best[:4])
             self.last_phone_bbox = (x, y, w, h)
             self.phone_detection_time = current_time
+            self._phone_tracker = self._create_phone_tracker(frame, (x, y, w, h))
             return (x, y, w, h)
 
         # No phone found - clear cache
         self.last_phone_bbox = None
         self.phone_detection_time = None
+        self._phone_tracker = None
         return None
 
+    def _create_phone_tracker(self, frame: cv2.Mat, bbox: Tuple[int, int, int, int]):
+        """
+        Initialize a CSRT tracker on the freshly detected phone bbox.
+
+        Returns None when the tracker isn't available in this OpenCV build
+        (opencv-python-headless without contrib) - the cache then behaves as
+        before, just without between-detection refinement.
+        """
+        create = getattr(cv2, 'TrackerCSRT_create', None)
+        if create is None and hasattr(cv2, 'legacy'):
+            create = getattr(cv2.legacy, 'TrackerCSRT_create', None)
+        if create is None:
+            return None
+
+        try:
+            tracker = create()
+            tracker.init(frame, bbox)
+            return tracker
+        except cv2.error as e:
+            logger.warning(f"Could not initialize phone tracker: {e}")
+            return None
+
+    def start_background(self):
+        """
+        Run capture + detection continuously on a dedicated thread.
+
+        The thread publishes only the newest DetectionResult (single slot,
+        overwrite semantics), so USB reads and model inference overlap with
+        whatever the consumer does with the previous result. Read with
+        get_latest_result().
+        """
+        if self._bg_thread is not None:
+            logger.warning("Background detection already running")
+            return
+
+        self._bg_stop.clear()
+        self._bg_thread = threading.Thread(target=self._background_loop, daemon=True)
+        self._bg_thread.start()
+        logger.info("Background detection started")
+
+    def _background_loop(self):
+        while not self._bg_stop.is_set():
+            result = self.detect()
+            if result is None:
+                continue
+            with self._bg_lock:
+                self._bg_result = result
+            self._bg_new.set()
+
+    def get_latest_result(self, timeout: float = 1.0) -> Optional[DetectionResult]:
+        """
+        Wait for and return the newest background DetectionResult.
+
+        Args:
+            timeout: Max seconds to wait for a fresh result
+
+        Returns:
+            The freshest DetectionResult, or None on timeout
+        """
+        if not self._bg_new.wait(timeout):
+            return None
+        self._bg_new.clear()
+        with self._bg_lock:
+            return self._bg_result
+
+    def stop_background(self):
+        """Stop the background detection thread."""
+        if self._bg_thread is None:
+            return
+        self._bg_stop.set()
+        self._bg_thread.join(timeout=2)
+        self._bg_thread = None
+        logger.info("Background detection stopped")
+
+    def enable_face_detection(self, enabled: bool):
+        """
+        Enable or disable the face detection pass.
+
+        The face target is only needed in the few frames leading up to a
+        spray; the orchestrator toggles this so the steady-state loop skips
+        the face graph and aims with the most recent cached position.
+
+        Args:
+            enabled: Whether face detection should run on each frame
+        """
+        if enabled != self._face_enabled and self.debug:
+            logger.info(f"Face detection {'enabled' if enabled else 'disabled'}")
+        self._face_enabled = enabled
+
+    def grab_only(self) -> bool:
+        """
+        Advance the camera by one frame without decoding it.
+
+        Used to implement frame skipping: skipped frames are only demuxed
+        by the capture thread, never decoded to BGR.
+
+        Returns:
+            True if a frame was skipped
+        """
+        return self.cap.grab_only()
+
     def invalidate_phone_cache(self):
         """
         Invalidate the phone cache, forcing re-detection on next frame.
@@ -173,135 +609,288 @@ class HandDetector:
         if self.debug:
             logger.info("Phone cache invalidated - will re-detect on next frame")
         self.phone_detection_time = None
+        self._phone_tracker = None
 
-    def _check_overlap(self, box1: Tuple[int, int, int, int],
-                      box2: Tuple[int, int, int, int]) -> bool:
+    def _run_hands(self, rgb_frame: np.ndarray):
         """
-        Check if two bounding boxes overlap.
+        Run the hand graph, cropped to the phone's neighbourhood when possible.
+
+        Only hands near the phone can trigger, so once a phone bbox is
+        cached the graph sees just a padded ROI around it - a fraction of
+        the pixels of the full frame. Every hand_roi_full_interval frames a
+        full-frame pass runs anyway so hands entering from elsewhere (and a
+        moved phone) are still picked up. Returned landmarks are translated
+        back to full-frame normalized coordinates, so downstream code never
+        sees the crop.
 
         Args:
-            box1: (x, y, w, h)
-            box2: (x, y, w, h)
+            rgb_frame: RGB frame at inference size
 
         Returns:
-            True if boxes overlap
+            MediaPipe Hands results with full-frame normalized landmarks
         """
-        x1, y1, w1, h1 = box1
-        x2, y2, w2, h2 = box2
-
-        # Check if one box is to the left of the other
-        if x1 + w1 < x2 or x2 + w2 < x1:
-            return False
-
-        # Check if one box is above the other
-        if y1 + h1 < y2 or y2 + h2 < y1:
-            return False
+        bbox = self.last_phone_bbox
+        self._roi_counter += 1
+        if (bbox is None or self.hand_roi_padding <= 0
+                or self._roi_counter % self.hand_roi_full_interval == 0):
+            return self.hands.process(rgb_frame)
+
+        sh, sw = rgb_frame.shape[:2]
+        scale_x = sw / self.frame_width
+        scale_y = sh / self.frame_height
+        pad = self.hand_roi_padding
+        x0 = max(0, int((bbox[0] - pad) * scale_x))
+        y0 = max(0, int((bbox[1] - pad) * scale_y))
+        x1 = min(sw, int((bbox[0] + bbox[2] + pad) * scale_x))
+        y1 = min(sh, int((bbox[1] + bbox[3] + pad) * scale_y))
+
+        # A crop that nearly covers the frame saves nothing - skip the copy
+        if (x1 - x0) * (y1 - y0) >= 0.8 * sw * sh:
+            return self.hands.process(rgb_frame)
+
+        roi = np.ascontiguousarray(rgb_frame[y0:y1, x0:x1])
+        roi.flags.writeable = False
+        results = self.hands.process(roi)
+
+        if results.multi_hand_landmarks:
+            roi_w, roi_h = x1 - x0, y1 - y0
+            for hand_landmarks in results.multi_hand_landmarks:
+                for lm in hand_landmarks.landmark:
+                    lm.x = (x0 + lm.x * roi_w) / sw
+                    lm.y = (y0 + lm.y * roi_h) / sh
+        return results
+
+    def _process(self, frame: cv2.Mat) -> DetectionResult:
+        """
+        Run the full detection pipeline once on a frame.
 
-        return True
+        The frame is converted to RGB exactly once and the same (read-only)
+        buffer is fed to both MediaPipe graphs, so each frame costs one
+        color conversion and one pass per model regardless of how many
+        consumers want the results.
 
-    def detect_hand_in_zone(self) -> Tuple[bool, Optional[Dict[str, float]], Optional[cv2.Mat]]:
-        """
-        Check if hand overlaps with phone and detect face for targeting.
+        Args:
+            frame: BGR frame
 
         Returns:
-            (hand_touching_phone, face_position, frame) tuple
-            - hand_touching_phone: True if hand overlaps with detected phone (trigger)
-            - face_position: Dict with 'x', 'y' normalized coordinates (0-1) of face center (target), or None
-            - frame: Current frame (or None if read failed)
+            DetectionResult (without the frame attached)
         """
         if self.show_timing:
             frame_start = time.time()
 
-        ret, frame = self.cap.read()
-        if not ret:
-            logger.warning("Failed to read frame from camera")
-            return False, None, None
-
-        # Detect phone using YOLOv8
-        if self.show_timing:
-            phone_start = time.time()
-        phone_bbox = self._detect_phone(frame)
-        if self.show_timing:
-            phone_time = (time.time() - phone_start) * 1000
+        # Convert BGR to RGB for MediaPipe - once, at inference size.
+        # Marking the buffer read-only lets MediaPipe skip its defensive
+        # copy.
+        if (frame.shape[1], frame.shape[0]) > self._mp_size:
+            cv2.resize(frame, self._mp_size, dst=self._small_buf,
+                       interpolation=cv2.INTER_AREA)
+            small = self._small_buf
+        else:
+            small = frame
+        rgb_frame = self._rgb_buf
+        rgb_frame.flags.writeable = True  # re-arm the reused buffer
+        if self._use_cuda_cvt:
+            self._gpu_bgr.upload(small)
+            cv2.cuda.cvtColor(self._gpu_bgr, cv2.COLOR_BGR2RGB).download(rgb_frame)
+        else:
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        rgb_frame.flags.writeable = False
 
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        hand_touching_phone = False
+        hands = []
+
+        # When steady-state face detection is on, kick the face graph off
+        # on its worker so it overlaps the hand graph below (wall clock
+        # becomes max of the two instead of their sum)
+        run_face = (
+            self._face_enabled
+            and self._face_counter % self.face_detect_interval == 0
+        )
+        self._face_counter += 1
+        face_future = (
+            self._face_pool.submit(self.face_detection.process, rgb_frame)
+            if run_face else None
+        )
 
-        # Detect hands using MediaPipe
+        # Detect hands first: with no hand in view nothing can trigger, so
+        # the phone cache refresh (tracker update / periodic YOLO
+        # re-detection) is skipped entirely on idle frames and the cached
+        # bbox is reported as-is for annotation.
         if self.show_timing:
             hand_start = time.time()
-        hand_results = self.hands.process(rgb_frame)
+        hand_results = self._run_hands(rgb_frame)
         if self.show_timing:
             hand_time = (time.time() - hand_start) * 1000
 
-        hand_touching_phone = False
-        hand_bboxes = []
-
+        if self.show_timing:
+            phone_start = time.time()
         if hand_results.multi_hand_landmarks:
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                # Calculate hand bounding box from landmarks
-                x_coords = [lm.x * self.frame_width for lm in hand_landmarks.landmark]
-                y_coords = [lm.y * self.frame_height for lm in hand_landmarks.landmark]
+            phone_bbox = self._detect_phone(frame)
+        else:
+            phone_bbox = self.last_phone_bbox
+        if phone_bbox is None and self.zone is not None:
+            zx1, zy1, zx2, zy2 = self.zone.get_pixel_coords(self.frame_width, self.frame_height)
+            phone_bbox = (zx1, zy1, zx2 - zx1, zy2 - zy1)
+        if self.show_timing:
+            phone_time = (time.time() - phone_start) * 1000
 
-                x_min = int(min(x_coords))
-                y_min = int(min(y_coords))
-                x_max = int(max(x_coords))
-                y_max = int(max(y_coords))
+        if hand_results.multi_hand_landmarks:
+            # Phone box edges in pixels, computed once for the point tests
+            if phone_bbox:
+                px1, py1 = phone_bbox[0], phone_bbox[1]
+                px2, py2 = px1 + phone_bbox[2], py1 + phone_bbox[3]
 
-                hand_bbox = (x_min, y_min, x_max - x_min, y_max - y_min)
-                hand_bboxes.append(hand_bbox)
+            fw, fh = self.frame_width, self.frame_height
 
-                # Check overlap with phone
-                if phone_bbox and self._check_overlap(hand_bbox, phone_bbox):
+            for hand_landmarks in hand_results.multi_hand_landmarks:
+                landmarks = hand_landmarks.landmark
+
+                # Trigger test: is any fingertip or the wrist inside the
+                # phone box? Pure-int point-in-box over 6 key landmarks
+                # with short-circuiting - no per-landmark bbox expansion
+                # and no NumPy allocation in the hot loop.
+                is_touching = bool(phone_bbox) and any(
+                    px1 <= landmarks[i].x * fw <= px2 and py1 <= landmarks[i].y * fh <= py2
+                    for i in self.KEY_LANDMARKS
+                )
+                if is_touching:
                     hand_touching_phone = True
                     if self.debug:
                         logger.info("HAND touching phone detected!")
 
-        # Detect face using MediaPipe (for targeting)
+                # Full hand bounding box - annotation only. One pass over
+                # the 21 landmarks into a NumPy array, then C-level
+                # reductions instead of four Python min()/max() loops.
+                pts = np.fromiter(
+                    (v for lm in landmarks for v in (lm.x, lm.y)),
+                    dtype=np.float32, count=42
+                ).reshape(21, 2)
+                pts *= (fw, fh)
+                x_min, y_min = pts.min(axis=0).astype(int)
+                x_max, y_max = pts.max(axis=0).astype(int)
+                hand_bbox = (int(x_min), int(y_min), int(x_max - x_min), int(y_max - y_min))
+
+                hands.append((hand_bbox, hand_landmarks, is_touching))
+
+        # Detect face using MediaPipe (for targeting). Face position is
+        # only consumed at spray time, so the orchestrator can switch this
+        # off during idle frames via enable_face_detection() and aim with
+        # its cached position instead.
+        face_position = None
+        face_detections = []
+
         if self.show_timing:
             face_start = time.time()
-        face_results = self.face_detection.process(rgb_frame)
+        if face_future is not None:
+            face_detections = face_future.result().detections or []
+            self._last_face_detections = face_detections
+        elif hand_touching_phone:
+            # Lazy evaluation: a touching hand always forces a face pass
+            # (the target must be fresh at trigger time) even while the
+            # orchestrator has steady-state face detection switched off
+            face_results = self.face_detection.process(rgb_frame)
+            face_detections = face_results.detections or []
+            self._last_face_detections = face_detections
+        elif self._face_enabled:
+            # Off-interval frame: reuse the last detections
+            face_detections = self._last_face_detections
         if self.show_timing:
             face_time = (time.time() - face_start) * 1000
 
-        face_position = None
-
-        if face_results.detections:
+        if face_detections:
             # Use the first detected face
-            detection = face_results.detections[0]
-            bbox = detection.location_data.relative_bounding_box
+            bbox = face_detections[0].location_data.relative_bounding_box
 
             # Calculate face center
-            face_x = bbox.xmin + bbox.width / 2
-            face_y = bbox.ymin + bbox.height / 2
-
             face_position = {
-                'x': face_x,
-                'y': face_y
+                'x': bbox.xmin + bbox.width / 2,
+                'y': bbox.ymin + bbox.height / 2
             }
 
             if self.debug:
-                logger.info(f"FACE detected at ({face_position['x']:.3f}, {face_position['y']:.3f})")
+                logger.info("FACE detected at (%.3f, %.3f)", face_position['x'], face_position['y'])
 
         if self.show_timing:
             total_time = (time.time() - frame_start) * 1000
-            logger.info(f"Frame timing: Phone={phone_time:.1f}ms, Hand={hand_time:.1f}ms, Face={face_time:.1f}ms, Total={total_time:.1f}ms")
-
-        return hand_touching_phone, face_position, frame
+            logger.info("Frame timing: Phone=%.1fms, Hand=%.1fms, Face=%.1fms, Total=%.1fms", phone_time, hand_time, face_time, total_time)
+
+        return DetectionResult(
+            hand_touching_phone=hand_touching_phone,
+            face_position=face_position,
+            phone_bbox=phone_bbox,
+            hands=hands,
+            face_detections=face_detections
+        )
 
-    def get_annotated_frame(self) -> Optional[cv2.Mat]:
+    def detect(self) -> Optional[DetectionResult]:
         """
-        Get a frame with phone, hand, and face detection drawn (for calibration/debugging).
+        Read one frame and run detection on it - no drawing.
+
+        This is the production entry point: the orchestrator only needs the
+        trigger flag and face target, so none of the annotation cost is
+        paid here.
 
         Returns:
-            Annotated frame or None if read failed
+            DetectionResult with the frame attached, or None if the camera
+            read failed
         """
         ret, frame = self.cap.read()
         if not ret:
+            logger.warning("Failed to read frame from camera")
             return None
 
-        # Detect phone using YOLOv8 (force=True to not skip frames during visualization)
-        phone_bbox = self._detect_phone(frame, force=True)
+        result = self._process(frame)
+        result.frame = frame
+        return result
+
+    def detect_hand_in_zone(self) -> Tuple[bool, Optional[Dict[str, float]], Optional[cv2.Mat]]:
+        """
+        Check if hand overlaps with phone and detect face for targeting.
+
+        Compatibility wrapper around detect().
+
+        Returns:
+            (hand_touching_phone, face_position, frame) tuple
+            - hand_touching_phone: True if hand overlaps with detected phone (trigger)
+            - face_position: Dict with 'x', 'y' normalized coordinates (0-1) of face center (target), or None
+            - frame: Current frame (or None if read failed)
+        """
+        result = self.detect()
+        if result is None:
+            return False, None, None
+        return result.hand_touching_phone, result.face_position, result.frame
+
+    def step(self) -> Tuple[Optional[cv2.Mat], bool, Optional[Dict[str, float]]]:
+        """
+        Process one frame and annotate it, running detection exactly once.
+
+        This is the debug/visualization entry point: unlike calling
+        get_annotated_frame() and detect_hand_in_zone() back to back, the
+        frame passes through YOLO and MediaPipe a single time.
+
+        Returns:
+            (annotated_frame, hand_touching_phone, face_position) tuple;
+            annotated_frame is None if the read failed
+        """
+        result = self.detect()
+        if result is None:
+            return None, False, None
+
+        self.annotate(result.frame, result)
+        return result.frame, result.hand_touching_phone, result.face_position
+
+    def annotate(self, frame: cv2.Mat, result: DetectionResult):
+        """
+        Draw phone, hand, and face detections onto a frame in place.
+
+        Pure drawing - everything it renders comes from an existing
+        detect() result, so no model runs here.
+
+        Args:
+            frame: BGR frame to draw on
+            result: DetectionResult from detect()
+        """
+        phone_bbox = result.phone_bbox
 
         if phone_bbox:
             x, y, w, h = phone_bbox
@@ -313,65 +902,66 @@ class HandDetector:
             cv2.putText(frame, "NO PHONE DETECTED",
                        (10, frame.shape[0] - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
 
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Draw hand landmarks and bounding boxes
+        for hand_bbox, hand_landmarks, is_touching in result.hands:
+            # Draw landmarks
+            self.mp_drawing.draw_landmarks(
+                frame,
+                hand_landmarks,
+                self._hand_connections,
+                self._landmark_spec,
+                self._connection_spec
+            )
+
+            # Draw hand bounding box
+            x_min, y_min, w, h = hand_bbox
+            x_max, y_max = x_min + w, y_min + h
+            color = (0, 0, 255) if is_touching else (255, 255, 0)  # Red if touching, cyan if not
+
+            cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), color, 2)
+            if is_touching:
+                cv2.putText(frame, "TOUCHING!", (x_min, y_min - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+
+        # Draw face detections
+        fw, fh = self.frame_width, self.frame_height
+        for detection in result.face_detections:
+            bbox = detection.location_data.relative_bounding_box
 
-        # Draw hand landmarks and bounding boxes using MediaPipe
-        hand_results = self.hands.process(rgb_frame)
-        if hand_results.multi_hand_landmarks:
-            mp_drawing = mp.solutions.drawing_utils
-            for hand_landmarks in hand_results.multi_hand_landmarks:
-                # Draw landmarks
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS
-                )
+            # Convert to pixel coordinates
+            x = int(bbox.xmin * fw)
+            y = int(bbox.ymin * fh)
+            w = int(bbox.width * fw)
+            h = int(bbox.height * fh)
 
-                # Draw hand bounding box
-                x_coords = [lm.x * self.frame_width for lm in hand_landmarks.landmark]
-                y_coords = [lm.y * self.frame_height for lm in hand_landmarks.landmark]
-                x_min, y_min = int(min(x_coords)), int(min(y_coords))
-                x_max, y_max = int(max(x_coords)), int(max(y_coords))
+            # Draw face bounding box
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
 
-                hand_bbox = (x_min, y_min, x_max - x_min, y_max - y_min)
+            # Draw center crosshair
+            center_x = x + w // 2
+            center_y = y + h // 2
+            cv2.drawMarker(frame, (center_x, center_y), (255, 0, 0),
+                          cv2.MARKER_CROSS, 20, 2)
+            cv2.putText(frame, "TARGET", (center_x - 30, center_y - 20),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
 
-                # Check if overlapping with phone
-                is_touching = phone_bbox and self._check_overlap(hand_bbox, phone_bbox)
-                color = (0, 0, 255) if is_touching else (255, 255, 0)  # Red if touching, cyan if not
+    def get_annotated_frame(self) -> Optional[cv2.Mat]:
+        """
+        Get a frame with phone, hand, and face detection drawn (for calibration/debugging).
 
-                cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), color, 2)
-                if is_touching:
-                    cv2.putText(frame, "TOUCHING!", (x_min, y_min - 10),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-
-        # Draw face detections using MediaPipe
-        face_results = self.face_detection.process(rgb_frame)
-        if face_results.detections:
-            for detection in face_results.detections:
-                bbox = detection.location_data.relative_bounding_box
-
-                # Convert to pixel coordinates
-                x = int(bbox.xmin * self.frame_width)
-                y = int(bbox.ymin * self.frame_height)
-                w = int(bbox.width * self.frame_width)
-                h = int(bbox.height * self.frame_height)
-
-                # Draw face bounding box
-                cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
-
-                # Draw center crosshair
-                center_x = x + w // 2
-                center_y = y + h // 2
-                cv2.drawMarker(frame, (center_x, center_y), (255, 0, 0),
-                              cv2.MARKER_CROSS, 20, 2)
-                cv2.putText(frame, "TARGET", (center_x - 30, center_y - 20),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+        Prefer step() when the detection results are also needed - this
+        wrapper discards them.
 
+        Returns:
+            Annotated frame or None if read failed
+        """
+        frame, _, _ = self.step()
         return frame
 
     def cleanup(self):
         """Release camera resources."""
+        self.stop_background()
+        self._face_pool.shutdown(wait=True)
         self.hands.close()
         self.face_detection.close()
         self.cap.release()
@@ -0,0 +1,124 @@
+import logging
+import cv2
+import numpy as np
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+
+class OnnxPhoneSession:
+    """
+    Direct ONNX Runtime session for the YOLOv8 phone detector.
+
+    Bypasses ultralytics' AutoBackend to run with persistent IO binding:
+    the input and output tensors are allocated once and reused every frame,
+    so inference skips the per-call host<->tensor copies and ndarray churn
+    that session.run() incurs. Only the cell-phone class is decoded.
+    """
+
+    CLASS_PHONE = 67  # cell phone in COCO dataset
+
+    def __init__(self, model_path: str, imgsz: int):
+        """
+        Initialize the session and pre-allocate the IO buffers.
+
+        Args:
+            model_path: Path to an exported .onnx model
+            imgsz: Inference image size the model was exported with
+
+        Raises:
+            ImportError: If onnxruntime is not installed
+            ValueError: If the model has dynamic shapes (re-export with
+                dynamic=False to use IO binding)
+        """
+        if ort is None:
+            raise ImportError("onnxruntime is not installed")
+
+        self.imgsz = imgsz
+
+        self.session = ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+        model_input = self.session.get_inputs()[0]
+        model_output = self.session.get_outputs()[0]
+
+        if not all(isinstance(d, int) for d in model_input.shape + model_output.shape):
+            raise ValueError(
+                f"{model_path} has dynamic shapes; re-export with dynamic=False "
+                "so IO buffers can be bound once"
+            )
+
+        # Persistent tensors: the letterbox canvas, the CHW float input and
+        # the raw (1, 84, N) output all live for the session's lifetime
+        self._canvas = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+        self._input = np.zeros(tuple(model_input.shape), dtype=np.float32)
+        self._output = np.zeros(tuple(model_output.shape), dtype=np.float32)
+
+        self._binding = self.session.io_binding()
+        self._binding.bind_input(
+            model_input.name, 'cpu', 0, np.float32,
+            self._input.shape, self._input.ctypes.data
+        )
+        self._binding.bind_output(
+            model_output.name, 'cpu', 0, np.float32,
+            self._output.shape, self._output.ctypes.data
+        )
+
+        logger.info(f"ONNX Runtime session bound: {model_path} ({imgsz}x{imgsz})")
+
+    def _preprocess(self, frame: np.ndarray) -> Tuple[float, int, int]:
+        """
+        Letterbox the frame into the bound input tensor.
+
+        Returns:
+            (scale, pad_x, pad_y) needed to map boxes back to frame pixels
+        """
+        h, w = frame.shape[:2]
+        scale = min(self.imgsz / w, self.imgsz / h)
+        new_w, new_h = round(w * scale), round(h * scale)
+        pad_x = (self.imgsz - new_w) // 2
+        pad_y = (self.imgsz - new_h) // 2
+
+        self._canvas[:] = 114
+        cv2.resize(frame, (new_w, new_h),
+                   dst=self._canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w])
+
+        # BGR HWC uint8 -> RGB CHW float32 in [0, 1], written in place
+        np.divide(self._canvas[:, :, ::-1].transpose(2, 0, 1), 255.0,
+                  out=self._input[0])
+
+        return scale, pad_x, pad_y
+
+    def detect_phones(self, frame: np.ndarray,
+                      conf_threshold: float) -> List[Tuple[int, int, int, int, float]]:
+        """
+        Run phone detection on a frame.
+
+        Args:
+            frame: BGR frame
+            conf_threshold: Minimum confidence to keep a detection
+
+        Returns:
+            List of (x, y, w, h, confidence) tuples in frame pixels
+        """
+        scale, pad_x, pad_y = self._preprocess(frame)
+
+        self.session.run_with_iobinding(self._binding)
+
+        # Output rows: 0-3 = cx, cy, w, h; 4+ = per-class scores
+        scores = self._output[0, 4 + self.CLASS_PHONE]
+        keep = scores >= conf_threshold
+        if not keep.any():
+            return []
+
+        boxes = self._output[0, :4, keep]
+        detections = []
+        for (cx, cy, bw, bh), conf in zip(boxes.T, scores[keep]):
+            x = int((cx - bw / 2 - pad_x) / scale)
+            y = int((cy - bh / 2 - pad_y) / scale)
+            detections.append((x, y, int(bw / scale), int(bh / scale), float(conf)))
+
+        return detections
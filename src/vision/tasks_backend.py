@@ -0,0 +1,140 @@
+"""
+Optional MediaPipe Tasks backends with GPU delegation.
+
+The legacy mp.solutions API used by HandDetector runs CPU-only (XNNPACK).
+On machines with a usable GPU the Tasks API can delegate the TFLite graphs
+to it, freeing the CPU for YOLO and capture. These wrappers expose the same
+process()/close() surface and result shapes as the legacy solutions, so the
+detector's landmark/bbox code and annotate() work unchanged.
+
+Requires the .task/.tflite model assets to be downloaded separately (see
+https://developers.google.com/mediapipe/solutions); construction raises if
+they are missing and the detector falls back to the CPU solutions.
+"""
+
+import logging
+import time
+from typing import Optional
+
+import mediapipe as mp
+from mediapipe.framework.formats import landmark_pb2, location_data_pb2, detection_pb2
+from mediapipe.tasks.python import BaseOptions
+from mediapipe.tasks.python import vision as mp_vision
+
+logger = logging.getLogger(__name__)
+
+
+class _Results:
+    """Minimal stand-in for the legacy solution output objects."""
+
+    __slots__ = ('multi_hand_landmarks', 'detections')
+
+    def __init__(self, multi_hand_landmarks=None, detections=None):
+        self.multi_hand_landmarks = multi_hand_landmarks
+        self.detections = detections
+
+
+class _TimestampClock:
+    """Strictly increasing millisecond timestamps for VIDEO running mode."""
+
+    def __init__(self):
+        self._t0 = time.monotonic()
+        self._last = -1
+
+    def next_ms(self) -> int:
+        ts = int((time.monotonic() - self._t0) * 1000)
+        if ts <= self._last:
+            ts = self._last + 1
+        self._last = ts
+        return ts
+
+
+class GpuHandLandmarker:
+    """
+    GPU-delegated drop-in for mp.solutions.hands.Hands.
+
+    process() returns an object with .multi_hand_landmarks holding
+    NormalizedLandmarkList protos, matching the legacy API (including
+    drawing_utils compatibility).
+    """
+
+    def __init__(self, model_asset_path: str, num_hands: int,
+                 min_detection_confidence: float, min_tracking_confidence: float):
+        options = mp_vision.HandLandmarkerOptions(
+            base_options=BaseOptions(
+                model_asset_path=model_asset_path,
+                delegate=BaseOptions.Delegate.GPU
+            ),
+            running_mode=mp_vision.RunningMode.VIDEO,
+            num_hands=num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self._landmarker = mp_vision.HandLandmarker.create_from_options(options)
+        self._clock = _TimestampClock()
+        logger.info(f"GPU hand landmarker loaded from {model_asset_path}")
+
+    def process(self, rgb_frame) -> _Results:
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        result = self._landmarker.detect_for_video(image, self._clock.next_ms())
+
+        multi = None
+        if result.hand_landmarks:
+            multi = [
+                landmark_pb2.NormalizedLandmarkList(landmark=[
+                    landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+                    for lm in hand
+                ])
+                for hand in result.hand_landmarks
+            ]
+        return _Results(multi_hand_landmarks=multi)
+
+    def close(self):
+        self._landmarker.close()
+
+
+class GpuFaceDetector:
+    """
+    GPU-delegated drop-in for mp.solutions.face_detection.FaceDetection.
+
+    process() returns an object with .detections holding Detection protos
+    whose location_data.relative_bounding_box matches the legacy API.
+    """
+
+    def __init__(self, model_asset_path: str, min_detection_confidence: float):
+        options = mp_vision.FaceDetectorOptions(
+            base_options=BaseOptions(
+                model_asset_path=model_asset_path,
+                delegate=BaseOptions.Delegate.GPU
+            ),
+            running_mode=mp_vision.RunningMode.VIDEO,
+            min_detection_confidence=min_detection_confidence
+        )
+        self._detector = mp_vision.FaceDetector.create_from_options(options)
+        self._clock = _TimestampClock()
+        logger.info(f"GPU face detector loaded from {model_asset_path}")
+
+    def process(self, rgb_frame) -> _Results:
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        result = self._detector.detect_for_video(image, self._clock.next_ms())
+
+        h, w = rgb_frame.shape[:2]
+        detections = []
+        for det in result.detections:
+            # Tasks returns pixel-space boxes; legacy consumers expect
+            # normalized relative_bounding_box coordinates
+            box = det.bounding_box
+            location = location_data_pb2.LocationData(
+                format=location_data_pb2.LocationData.RELATIVE_BOUNDING_BOX,
+                relative_bounding_box=location_data_pb2.LocationData.RelativeBoundingBox(
+                    xmin=box.origin_x / w,
+                    ymin=box.origin_y / h,
+                    width=box.width / w,
+                    height=box.height / h
+                )
+            )
+            detections.append(detection_pb2.Detection(location_data=location))
+        return _Results(detections=detections)
+
+    def close(self):
+        self._detector.close()
@@ -1,9 +1,24 @@
 import logging
 from dataclasses import dataclass
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+def _contains(zx, zy, zw, zh, x, y):
+    """Scalar point-in-zone test, JIT-compiled when numba is installed."""
+    return zx <= x <= zx + zw and zy <= y <= zy + zh
+
+
+try:
+    from numba import njit
+    _contains = njit(cache=True)(_contains)
+except ImportError:
+    # Optional dependency - pure-Python fallback is fine at this call rate
+    pass
+
+
 @dataclass
 class PhoneZone:
     """Represents the phone detection zone in the camera frame."""
@@ -48,9 +63,22 @@ class PhoneZone:
         Returns:
             True if point is inside zone
         """
+        return bool(_contains(self.x, self.y, self.width, self.height, x, y))
+
+    def contains_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Check many normalized points against the zone in one pass.
+
+        Args:
+            xs: Array of normalized x coordinates (0-1)
+            ys: Array of normalized y coordinates (0-1)
+
+        Returns:
+            Bool array, True where the point is inside the zone
+        """
         return (
-            self.x <= x <= (self.x + self.width) and
-            self.y <= y <= (self.y + self.height)
+            (xs >= self.x) & (xs <= self.x + self.width) &
+            (ys >= self.y) & (ys <= self.y + self.height)
         )
 
     def contains_pixel_point(self, px: int, py: int, frame_width: int, frame_height: int) -> bool: